@@ -1,5 +1,6 @@
-from src.gui.main_window import MainWindow
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWidgets import QApplication, QSplashScreen
+from PyQt5.QtGui import QPixmap, QColor
+from PyQt5.QtCore import Qt
 import logging
 import sys
 
@@ -31,11 +32,22 @@ def main():
     app.setOrganizationName("NovoGround")
     app.setOrganizationDomain("novoground.com")
 
+    # Paint a splash before pulling in the heavy GUI/3D modules
+    splash_pixmap = QPixmap(400, 200)
+    splash_pixmap.fill(QColor("#2E2E2E"))
+    splash = QSplashScreen(splash_pixmap)
+    splash.showMessage("Loading NovoGround GCS...", Qt.AlignCenter, Qt.white)
+    splash.show()
+    app.processEvents()
+
+    from src.gui.main_window import MainWindow
+
     # Specify the path to the rocket model file if available
     rocket_model_path = "models/rocket.egg"  # Update this path as needed
 
     main_window = MainWindow(rocket_model_path=rocket_model_path)
     main_window.show()
+    splash.finish(main_window)
 
     try:
         # Use the standard Qt event loop
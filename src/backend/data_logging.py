@@ -1,21 +1,60 @@
-from src.utils.constants import LOG_DIR, TELEMETRY_LOG_FILE
+from src.utils.constants import (LOG_DIR, TELEMETRY_LOG_FILE, TELEMETRY_BINARY_LOG_FILE,
+                                 TELEMETRY_LOG_BUFFER_SIZE, TELEMETRY_LOG_FLUSH_ROWS,
+                                 TELEMETRY_LOG_FLUSH_INTERVAL, TELEMETRY_BINARY_CHUNK_SIZE)
 from src.utils.telemetry_data import TelemetryData
 from src.utils.logger import logger
 import threading
+import struct
+import time
 import csv
 
 
+CSV_FIELDNAMES = (
+    'timestamp',
+    'position_x',
+    'position_y',
+    'position_z',
+    'orientation_pitch',
+    'orientation_yaw',
+    'orientation_roll',
+    'velocity_x',
+    'velocity_y',
+    'velocity_z',
+    'acceleration_x',
+    'acceleration_y',
+    'acceleration_z',
+    'voltage',
+    'status_flags',
+)
+
+# Fixed-size binary record: timestamp, 12 vector components, voltage, status flag bits
+BINARY_RECORD = struct.Struct('<d12dIB')
+
+
 class DataLogger:
     """
     Handles logging of telemetry data for post-mission analysis.
-    Supports writing data to CSV format.
+    Writes fixed-size binary records by default, or CSV when binary is False.
+
+    _is_logging is only ever assigned while holding _lock, so log_data can read
+    it without the lock as a fast no-op when logging is disabled. Only the
+    file write itself is serialized.
+
+    While logging, a background thread flushes buffered rows every
+    TELEMETRY_LOG_FLUSH_INTERVAL, so samples are written out even if the stream stops.
     """
-    def __init__(self):
-        self.log_file_path = LOG_DIR / TELEMETRY_LOG_FILE
-        self._is_logging = False
+    def __init__(self, binary: bool = True):
+        self.binary = binary
+        self.log_file_path = LOG_DIR / (TELEMETRY_BINARY_LOG_FILE if binary else TELEMETRY_LOG_FILE)
+        self._is_logging = False  # atomic: written under _lock, read lock-free
         self._lock = threading.Lock()
         self._file = None
         self._csv_writer = None
+        self._rows_since_flush = 0
+        self._last_flush = 0.0
+        self._record_buffer = None
+        self._record_offset = 0
+        self._flush_stop = None  # threading.Event ending the periodic flush thread
 
     def start_logging(self) -> None:
         """
@@ -28,36 +67,32 @@ class DataLogger:
 
             try:
                 LOG_DIR.mkdir(parents=True, exist_ok=True)
-                self._file = open(self.log_file_path, mode='w', newline='')
-                self._csv_writer = csv.DictWriter(
-                    self._file,
-                    fieldnames=[
-                        'timestamp',
-                        'position_x',
-                        'position_y',
-                        'position_z',
-                        'orientation_pitch',
-                        'orientation_yaw',
-                        'orientation_roll',
-                        'velocity_x',
-                        'velocity_y',
-                        'velocity_z',
-                        'acceleration_x',
-                        'acceleration_y',
-                        'acceleration_z',
-                        'voltage',
-                        'motor_failure',
-                        'sensor_error',
-                        'system_health',
-                        'sensor_status'
-                    ]
-                )
-                self._csv_writer.writeheader()
+                if self.binary:
+                    # A buffered writer writes each chunk completely; a raw file may write it only partly
+                    self._file = open(self.log_file_path, mode='wb')
+                    records_per_chunk = TELEMETRY_BINARY_CHUNK_SIZE // BINARY_RECORD.size
+                    self._record_buffer = bytearray(records_per_chunk * BINARY_RECORD.size)
+                    self._record_offset = 0
+                else:
+                    self._file = open(self.log_file_path, mode='w', newline='',
+                                      buffering=TELEMETRY_LOG_BUFFER_SIZE)
+                    self._csv_writer = csv.writer(self._file)
+                    self._csv_writer.writerow(CSV_FIELDNAMES)
+                self._rows_since_flush = 0
+                self._last_flush = time.monotonic()
                 self._is_logging = True
-                logger.log_event(f"Started logging telemetry data to {self.log_file_path}", "INFO")
+                self._flush_stop = threading.Event()
+                threading.Thread(target=self._flush_periodically, args=(self._flush_stop,),
+                                 name='DataLoggerFlush', daemon=True).start()
+                logger.log_event("Started logging telemetry data to %s", "INFO", self.log_file_path)
             except Exception as e:
-                logger.log_event(f"Failed to start data logging: {str(e)}", "ERROR")
-                self.stop_logging()
+                logger.log_event("Failed to start data logging: %s", "ERROR", e)
+                # stop_logging would re-acquire the non-reentrant lock, so clean up here
+                if self._file:
+                    self._file.close()
+                self._file = None
+                self._csv_writer = None
+                self._record_buffer = None
 
     def stop_logging(self) -> None:
         """
@@ -68,13 +103,51 @@ class DataLogger:
                 logger.log_event("Data logging is not active.", "WARNING")
                 return
 
+            # The flush thread exits on its own; it cannot be joined while _lock is held
+            self._flush_stop.set()
             try:
                 if self._file:
+                    self._flush_buffers(time.monotonic())
+                    self._record_buffer = None
                     self._file.close()
+                self._csv_writer = None
                 self._is_logging = False
                 logger.log_event("Stopped telemetry data logging.", "INFO")
             except Exception as e:
-                logger.log_event(f"Failed to stop data logging: {str(e)}", "ERROR")
+                logger.log_event("Failed to stop data logging: %s", "ERROR", e)
+
+    def flush(self) -> None:
+        """
+        Writes out all buffered telemetry rows or records and flushes the log file.
+        """
+        with self._lock:
+            if self._is_logging:
+                self._flush_buffers(time.monotonic())
+
+    def _flush_periodically(self, stop: threading.Event) -> None:
+        """
+        Body of the flush thread: flushes once per interval until stop is set.
+        """
+        while not stop.wait(TELEMETRY_LOG_FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.log_event("Failed to flush telemetry log, stopping data logging: %s", "ERROR", e)
+                self.stop_logging()
+                return
+
+    def _flush_buffers(self, now: float) -> None:
+        """
+        Writes pending binary records and flushes the file. Must be called with _lock held.
+
+        :param now: time.monotonic() value recorded as the last flush time.
+        """
+        if self._record_offset:
+            self._file.write(memoryview(self._record_buffer)[:self._record_offset])
+            self._record_offset = 0
+        self._file.flush()
+        self._rows_since_flush = 0
+        self._last_flush = now
 
     def log_data(self, telemetry: TelemetryData) -> None:
         """
@@ -85,35 +158,76 @@ class DataLogger:
         if not self._is_logging:
             return
 
+        if self.binary:
+            self.log_binary(telemetry)
+            return
+
         try:
+            # Flatten position, orientation, velocity, acceleration tuples
+            row = (
+                telemetry.timestamp_iso,
+                *telemetry.position,
+                *telemetry.orientation,
+                *telemetry.velocity,
+                *telemetry.acceleration,
+                telemetry.voltage,
+                telemetry.flags_bits,
+            )
+
             with self._lock:
+                if not self._is_logging:
+                    return
                 if not self._csv_writer:
                     raise ValueError("CSV writer is not initialized.")
-                
-                data_dict = telemetry.to_dict()
-                # Flatten position, orientation, velocity, acceleration tuples
-                flat_data = {
-                    'timestamp': data_dict['timestamp'],
-                    'position_x': data_dict['position'][0],
-                    'position_y': data_dict['position'][1],
-                    'position_z': data_dict['position'][2],
-                    'orientation_pitch': data_dict['orientation'][0],
-                    'orientation_yaw': data_dict['orientation'][1],
-                    'orientation_roll': data_dict['orientation'][2],
-                    'velocity_x': data_dict['velocity'][0],
-                    'velocity_y': data_dict['velocity'][1],
-                    'velocity_z': data_dict['velocity'][2],
-                    'acceleration_x': data_dict['acceleration'][0],
-                    'acceleration_y': data_dict['acceleration'][1],
-                    'acceleration_z': data_dict['acceleration'][2],
-                    'voltage': data_dict['voltage'],
-                    'motor_failure': data_dict['status_flags'].get('motor_failure', False),
-                    'sensor_error': data_dict['status_flags'].get('sensor_error', False),
-                    'system_health': data_dict['status_flags'].get('system_health', False),
-                    'sensor_status': data_dict['status_flags'].get('sensor_status', False),
-                }
-                self._csv_writer.writerow(flat_data)
-                self._file.flush()
+
+                self._csv_writer.writerow(row)
+
+                # Let the buffered file absorb bursts; flush every N rows or ~1 s
+                self._rows_since_flush += 1
+                now = time.monotonic()
+                if (self._rows_since_flush >= TELEMETRY_LOG_FLUSH_ROWS
+                        or now - self._last_flush >= TELEMETRY_LOG_FLUSH_INTERVAL):
+                    self._flush_buffers(now)
+        except Exception as e:
+            logger.log_event("Failed to log telemetry data, stopping data logging: %s", "ERROR", e)
+            self.stop_logging()
+
+    def log_binary(self, telemetry: TelemetryData) -> None:
+        """
+        Packs a telemetry data point into the binary record buffer, writing
+        the buffer out whenever a full chunk has accumulated.
+
+        :param telemetry: TelemetryData object containing the data to log.
+        """
+        if not self._is_logging:
+            return
+
+        try:
+            record = (
+                telemetry.timestamp_seconds,
+                *telemetry.position,
+                *telemetry.orientation,
+                *telemetry.velocity,
+                *telemetry.acceleration,
+                # struct's integer formats reject floats, so coerce values that may arrive as floats
+                int(telemetry.voltage),
+                telemetry.flags_bits,
+            )
+
+            with self._lock:
+                if not self._is_logging:
+                    return
+                if self._record_buffer is None:
+                    raise ValueError("Binary record buffer is not initialized.")
+
+                BINARY_RECORD.pack_into(self._record_buffer, self._record_offset, *record)
+                self._record_offset += BINARY_RECORD.size
+
+                # Write out full chunks, or whatever has accumulated after ~1 s
+                now = time.monotonic()
+                if (self._record_offset == len(self._record_buffer)
+                        or now - self._last_flush >= TELEMETRY_LOG_FLUSH_INTERVAL):
+                    self._flush_buffers(now)
         except Exception as e:
-            logger.log_event(f"Failed to log telemetry data: {str(e)}", "ERROR")
-            self.stop_logging()
\ No newline at end of file
+            logger.log_event("Failed to log telemetry data, stopping data logging: %s", "ERROR", e)
+            self.stop_logging()
@@ -1,10 +1,50 @@
-from src.utils.constants import LOG_DIR, TELEMETRY_LOG_FILE
-from src.utils.telemetry_data import TelemetryData
-from PyQt5.QtCore import QObject, pyqtSignal
+from src.utils.constants import LOG_DIR, TELEMETRY_LOG_FILE, TELEMETRY_BINARY_LOG_FILE
+from src.utils.telemetry_data import TelemetryData, status_flags_from_bits
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from src.utils.logger import logger
-import threading
+from datetime import datetime, timezone
+from typing import Callable
+import numpy as np
 import time
-import csv
+
+
+# Mirrors data_logging.BINARY_RECORD so a whole log maps onto one structured array
+BINARY_RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('values', '<f8', (12,)),
+    ('voltage', '<u4'),
+    ('flags', 'u1'),
+])
+
+# One CSV row: ISO timestamp, position/orientation/velocity/acceleration/voltage, packed status flag bits
+CSV_RECORD_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[us]'),
+    ('values', '<f8', (13,)),
+    ('flags', 'u1'),
+])
+
+
+def csv_timestamp(text: str) -> np.datetime64:
+    """
+    Parses a logged ISO timestamp into a naive UTC datetime64, since numpy has no timezone-aware form.
+    """
+    timestamp = datetime.fromisoformat(text)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(timestamp, 'us')
+
+
+class PlaybackThread(QThread):
+    """
+    Qt-managed worker thread that runs the playback loop off the GUI thread.
+    Signals emitted from it reach GUI-thread slots through queued connections.
+    """
+    def __init__(self, target: Callable[[], None], parent: QObject = None):
+        super().__init__(parent)
+        self._target = target
+
+    def run(self) -> None:
+        self._target()
 
 
 class DataPlayback(QObject):
@@ -15,14 +55,18 @@ class DataPlayback(QObject):
     playback_stopped = pyqtSignal()
     telemetry_emitted = pyqtSignal(object)  # Emits TelemetryData objects
 
-    def __init__(self, parent: QObject = None):
+    def __init__(self, parent: QObject = None, binary: bool = True):
         super().__init__(parent)
-        self.log_file_path = LOG_DIR / TELEMETRY_LOG_FILE
+        self.binary = binary
+        self.log_file_path = LOG_DIR / (TELEMETRY_BINARY_LOG_FILE if binary else TELEMETRY_LOG_FILE)
         self.playback_thread = None
         self._is_playing = False
         self._playback_speed = 1.0  # 1x speed
         self._current_index = 0
-        self.telemetry_data = []
+        # Column-oriented log contents; TelemetryData is only built at emit time
+        self._values = np.empty((0, 13), dtype=np.float64)
+        self._flags = np.empty(0, dtype=np.uint8)  # packed status flag bits
+        self._times = np.empty(0, dtype=np.int64)  # nanoseconds since first record
 
     def load_log(self) -> bool:
         """
@@ -31,35 +75,47 @@ class DataPlayback(QObject):
         :return: True if loading is successful, False otherwise.
         """
         if not self.log_file_path.exists():
-            logger.log_event(f"Log file {self.log_file_path} does not exist.", "ERROR")
+            logger.log_event("Log file %s does not exist.", "ERROR", self.log_file_path)
             return False
 
         try:
-            with open(self.log_file_path, mode='r') as csvfile:
-                reader = csv.DictReader(csvfile)
-                self.telemetry_data = []
-                for row in reader:
-                    telemetry = TelemetryData(
-                        position=(float(row['position_x']), float(row['position_y']), float(row['position_z'])),
-                        orientation=(float(row['orientation_pitch']), float(row['orientation_yaw']), float(row['orientation_roll'])),
-                        velocity=(float(row['velocity_x']), float(row['velocity_y']), float(row['velocity_z'])),
-                        acceleration=(float(row['acceleration_x']), float(row['acceleration_y']), float(row['acceleration_z'])),
-                        voltage=int(row['voltage']),
-                        status_flags={
-                            'motor_failure': row['motor_failure'].lower() == 'true',
-                            'sensor_error': row['sensor_error'].lower() == 'true',
-                            'system_health': row['system_health'].lower() == 'true',
-                            'sensor_status': row['sensor_status'].lower() == 'true',
-                        },
-                        timestamp=None  # Timestamp can be handled separately if needed
-                    )
-                    self.telemetry_data.append(telemetry)
-            logger.log_event(f"Loaded {len(self.telemetry_data)} telemetry records from {self.log_file_path}", "INFO")
+            if self.binary:
+                self._load_binary_log()
+            else:
+                self._load_csv_log()
+            logger.log_event("Loaded %d telemetry records from %s", "INFO", len(self._values), self.log_file_path)
             return True
         except Exception as e:
-            logger.log_event(f"Failed to load telemetry log: {str(e)}", "ERROR")
+            logger.log_event("Failed to load telemetry log: %s", "ERROR", e)
             return False
 
+    def _load_binary_log(self) -> None:
+        """
+        Maps the fixed-size binary log directly onto a structured array.
+        """
+        records = np.fromfile(self.log_file_path, dtype=BINARY_RECORD_DTYPE)
+        self._values = np.column_stack((records['values'], records['voltage']))
+        self._flags = records['flags']
+        timestamps = records['timestamp']
+        if len(timestamps):
+            self._times = np.rint((timestamps - timestamps[0]) * 1e9).astype(np.int64)
+        else:
+            self._times = np.empty(0, dtype=np.int64)
+
+    def _load_csv_log(self) -> None:
+        """
+        Parses the CSV log in a single pass into a structured array, then splits it into columns.
+        """
+        records = np.loadtxt(self.log_file_path, delimiter=',', skiprows=1, dtype=CSV_RECORD_DTYPE,
+                             converters={0: csv_timestamp}, encoding='utf-8', ndmin=1)
+        self._values = np.ascontiguousarray(records['values'])
+        self._flags = records['flags']
+        timestamps = records['timestamp']
+        if len(timestamps):
+            self._times = (timestamps - timestamps[0]).astype('timedelta64[ns]').astype(np.int64)
+        else:
+            self._times = np.empty(0, dtype=np.int64)
+
     def start_playback(self) -> None:
         """
         Starts the playback of telemetry data.
@@ -68,12 +124,12 @@ class DataPlayback(QObject):
             logger.log_event("Data playback is already in progress.", "WARNING")
             return
 
-        if not self.telemetry_data:
+        if not len(self._values):
             logger.log_event("No telemetry data loaded for playback.", "WARNING")
             return
 
         self._is_playing = True
-        self.playback_thread = threading.Thread(target=self._playback_loop, daemon=True)
+        self.playback_thread = PlaybackThread(self._playback_loop, self)
         self.playback_thread.start()
         self.playback_started.emit()
         logger.log_event("Data playback started.", "INFO")
@@ -83,27 +139,45 @@ class DataPlayback(QObject):
         Internal method to handle the playback loop.
         """
         try:
-            previous_timestamp = None
-            for telemetry in self.telemetry_data:
+            # Schedule against a monotonic deadline so sleep overshoot does not accumulate
+            times = self._times.tolist()
+            next_tick_ns = time.monotonic_ns()
+            for index in range(len(self._values)):
                 if not self._is_playing:
                     break
 
-                current_timestamp = telemetry.timestamp or time.time()
-                if previous_timestamp:
-                    # Calculate time difference and adjust sleep based on playback speed
-                    time_diff = current_timestamp - previous_timestamp
-                    adjusted_sleep = time_diff / self._playback_speed
-                    if adjusted_sleep > 0:
-                        time.sleep(adjusted_sleep)
-                previous_timestamp = current_timestamp
+                if index:
+                    next_tick_ns += int((times[index] - times[index - 1]) / self._playback_speed)
+                    delay_ns = next_tick_ns - time.monotonic_ns()
+                    if delay_ns > 0:
+                        time.sleep(delay_ns / 1e9)
 
+                telemetry = self._telemetry_at(index)
                 self.telemetry_emitted.emit(telemetry)
             self.stop_playback()
             logger.log_event("Data playback completed.", "INFO")
         except Exception as e:
-            logger.log_event(f"Error during data playback: {str(e)}", "ERROR")
+            logger.log_event("Error during data playback: %s", "ERROR", e)
             self.stop_playback()
 
+    def _telemetry_at(self, index: int) -> TelemetryData:
+        """
+        Builds the TelemetryData object for a single loaded record.
+
+        :param index: Row index into the loaded log.
+        :return: TelemetryData object for that row.
+        """
+        values = self._values[index].tolist()
+        return TelemetryData(
+            position=tuple(values[0:3]),
+            orientation=tuple(values[3:6]),
+            velocity=tuple(values[6:9]),
+            acceleration=tuple(values[9:12]),
+            voltage=int(values[12]),
+            status_flags=status_flags_from_bits(int(self._flags[index])),
+            timestamp=None  # Timestamp can be handled separately if needed
+        )
+
     def stop_playback(self) -> None:
         """
         Stops the telemetry data playback.
@@ -113,8 +187,10 @@ class DataPlayback(QObject):
             return
 
         self._is_playing = False
-        if self.playback_thread and self.playback_thread.is_alive():
-            self.playback_thread.join()
+        # The loop itself calls stop_playback when it finishes; never wait on our own thread
+        if (self.playback_thread and self.playback_thread.isRunning()
+                and QThread.currentThread() is not self.playback_thread):
+            self.playback_thread.wait()
         self.playback_thread = None
         self.playback_stopped.emit()
         logger.log_event("Data playback stopped.", "INFO")
@@ -129,4 +205,4 @@ class DataPlayback(QObject):
             logger.log_event("Playback speed must be positive.", "WARNING")
             return
         self._playback_speed = speed
-        logger.log_event(f"Playback speed set to {self._playback_speed}x.", "INFO")
\ No newline at end of file
+        logger.log_event("Playback speed set to %sx.", "INFO", self._playback_speed)
\ No newline at end of file
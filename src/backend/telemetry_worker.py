@@ -0,0 +1,52 @@
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from typing import Any, Callable, Dict, Optional
+from src.utils.logger import logger
+import threading
+
+# Pause after a failed receive so a broken transport does not spin the loop
+RECEIVE_ERROR_BACKOFF = 1.0  # seconds
+
+
+class TelemetryWorker(QObject):
+    """
+    Acquires telemetry off the GUI thread and pushes each sample to the GUI
+    through the telemetry_ready signal. Intended to be moved to a QThread.
+    """
+    telemetry_ready = pyqtSignal(dict)
+    finished = pyqtSignal()
+
+    def __init__(self, receive: Callable[[], Optional[Dict[str, Any]]], poll_interval: float = 0.0,
+                 parent: QObject = None):
+        """
+        :param receive: Callable returning the next telemetry sample. It may block on the transport.
+        :param poll_interval: Seconds to wait between samples, for sources that do not block.
+        """
+        super().__init__(parent)
+        self._receive = receive
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+
+    @pyqtSlot()
+    def run(self) -> None:
+        """
+        Receives telemetry until stop() is called.
+        """
+        while not self._stop_event.is_set():
+            try:
+                data = self._receive()
+                if data:
+                    self.telemetry_ready.emit(data)
+            except Exception as e:
+                logger.log_event("Error in telemetry worker: %s", "ERROR", e)
+                self._stop_event.wait(RECEIVE_ERROR_BACKOFF)
+                continue
+
+            if self._poll_interval:
+                self._stop_event.wait(self._poll_interval)
+        self.finished.emit()
+
+    def stop(self) -> None:
+        """
+        Asks the receive loop to exit after the current sample. Safe to call from any thread.
+        """
+        self._stop_event.set()
@@ -1,4 +1,17 @@
 from .main_window import MainWindow
-from .telemetry_dashboard import TelemetryDashboard
 from .mission_control_panel import MissionControlPanel
-from .graph_visualization import GraphVisualization
\ No newline at end of file
+from .rocket_view_widget import RocketViewWidget
+
+# Widgets not needed by MainWindow are imported on first access
+_LAZY_IMPORTS = {
+    'TelemetryDashboard': '.telemetry_dashboard',
+    'GraphVisualization': '.graph_visualization',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,8 +1,9 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
 from PyQt5.QtCore import QTimer, pyqtSlot
-from pyqtgraph import PlotWidget
+from pyqtgraph import GraphicsLayoutWidget
 from .styles import GRAPH_STYLE
-from collections import deque
+import numpy as np
+import time
 
 
 
@@ -13,6 +14,7 @@ class GraphVisualization(QWidget):
     """
     def __init__(self, parent=None):
         super(GraphVisualization, self).__init__(parent)
+        self.max_data_points = 100
         self.init_ui()
         self.init_graphs()
         self.init_data_buffers()
@@ -22,61 +24,68 @@ class GraphVisualization(QWidget):
         self.setStyleSheet(GRAPH_STYLE)
         layout = QVBoxLayout()
         
+        # All plots share a single scene so one redraw covers every curve
+        self.graphics_layout = GraphicsLayoutWidget()
+        layout.addWidget(self.graphics_layout)
+        
         # Pitch Graph
-        self.pitch_plot = PlotWidget(title="Pitch Over Time")
-        self.pitch_plot.setLabel('left', 'Pitch', units='degrees')
-        self.pitch_plot.setLabel('bottom', 'Time', units='s')
+        self.pitch_plot = self.add_plot(0, "Pitch Over Time", 'Pitch', 'degrees')
         self.pitch_curve = self.pitch_plot.plot(pen='y')
-        layout.addWidget(self.pitch_plot)
         
         # Yaw Graph
-        self.yaw_plot = PlotWidget(title="Yaw Over Time")
-        self.yaw_plot.setLabel('left', 'Yaw', units='degrees')
-        self.yaw_plot.setLabel('bottom', 'Time', units='s')
+        self.yaw_plot = self.add_plot(1, "Yaw Over Time", 'Yaw', 'degrees')
         self.yaw_curve = self.yaw_plot.plot(pen='c')
-        layout.addWidget(self.yaw_plot)
         
         # Roll Graph
-        self.roll_plot = PlotWidget(title="Roll Over Time")
-        self.roll_plot.setLabel('left', 'Roll', units='degrees')
-        self.roll_plot.setLabel('bottom', 'Time', units='s')
+        self.roll_plot = self.add_plot(2, "Roll Over Time", 'Roll', 'degrees')
         self.roll_curve = self.roll_plot.plot(pen='m')
-        layout.addWidget(self.roll_plot)
         
         # Position Graphs
-        self.x_plot = PlotWidget(title="X Position Over Time")
-        self.x_plot.setLabel('left', 'X Position', units='m')
-        self.x_plot.setLabel('bottom', 'Time', units='s')
+        self.x_plot = self.add_plot(3, "X Position Over Time", 'X Position', 'm')
         self.x_curve = self.x_plot.plot(pen='r')
-        layout.addWidget(self.x_plot)
         
-        self.y_plot = PlotWidget(title="Y Position Over Time")
-        self.y_plot.setLabel('left', 'Y Position', units='m')
-        self.y_plot.setLabel('bottom', 'Time', units='s')
+        self.y_plot = self.add_plot(4, "Y Position Over Time", 'Y Position', 'm')
         self.y_curve = self.y_plot.plot(pen='g')
-        layout.addWidget(self.y_plot)
         
-        self.z_plot = PlotWidget(title="Z Position Over Time")
-        self.z_plot.setLabel('left', 'Z Position', units='m')
-        self.z_plot.setLabel('bottom', 'Time', units='s')
+        self.z_plot = self.add_plot(5, "Z Position Over Time", 'Z Position', 'm')
         self.z_curve = self.z_plot.plot(pen='b')
-        layout.addWidget(self.z_plot)
         
         self.setLayout(layout)
     
+    def add_plot(self, row, title, label, units):
+        """
+        Adds a plot row to the shared layout, linked to the pitch plot's time axis.
+        
+        Args:
+            row (int): Row in the graphics layout.
+            title (str): Plot title.
+            label (str): Left axis label.
+            units (str): Left axis units.
+        """
+        plot = self.graphics_layout.addPlot(row=row, col=0, title=title)
+        plot.setLabel('left', label, units=units)
+        plot.setLabel('bottom', 'Time', units='s')
+        # Skip the per-plot context menu and auto-range button construction
+        plot.hideButtons()
+        plot.setMenuEnabled(False)
+        # Let pyqtgraph decimate dense data and skip points outside the view
+        plot.setDownsampling(auto=True, mode='peak')
+        plot.setClipToView(True)
+        if row > 0:
+            plot.setXLink(self.pitch_plot)
+        return plot
+    
     def init_graphs(self):
         # Initialize graph parameters if needed
         pass
     
     def init_data_buffers(self):
-        # Deques to store data points for each parameter
-        self.time_buffer = deque(maxlen=100)
-        self.pitch_buffer = deque(maxlen=100)
-        self.yaw_buffer = deque(maxlen=100)
-        self.roll_buffer = deque(maxlen=100)
-        self.x_buffer = deque(maxlen=100)
-        self.y_buffer = deque(maxlen=100)
-        self.z_buffer = deque(maxlen=100)
+        # Ring buffer with one row per series: time, pitch, yaw, roll, x, y, z.
+        # Each sample is written twice, N columns apart, so the latest N samples
+        # are always one contiguous view and every curve shares the same x array.
+        self.data_buffer = np.zeros((7, 2 * self.max_data_points), dtype=np.float64)
+        self.buffer_index = 0
+        self.buffer_count = 0
         self.start_time = None
     
     def init_timer(self):
@@ -85,6 +94,17 @@ class GraphVisualization(QWidget):
         self.timer.timeout.connect(self.update_graphs)
         self.timer.start(100)  # Update every 100 ms
     
+    def showEvent(self, event):
+        # Resume redraws once the graphs are on screen again
+        self.timer.start(100)
+        self.update_graphs()
+        super(GraphVisualization, self).showEvent(event)
+    
+    def hideEvent(self, event):
+        # No point redrawing while hidden (e.g. on an inactive tab)
+        self.timer.stop()
+        super(GraphVisualization, self).hideEvent(event)
+    
     @pyqtSlot(dict)
     def receive_telemetry(self, data):
         """
@@ -93,37 +113,44 @@ class GraphVisualization(QWidget):
         Args:
             data (dict): Telemetry data containing orientation and position.
         """
-        import time
         if self.start_time is None:
-            self.start_time = time.time()
-        
-        current_time = time.time() - self.start_time
-        self.time_buffer.append(current_time)
+            self.start_time = time.monotonic()
         
         orientation = data.get('orientation', {})
         position = data.get('position', {})
         
-        self.pitch_buffer.append(orientation.get('pitch', 0.0))
-        self.yaw_buffer.append(orientation.get('yaw', 0.0))
-        self.roll_buffer.append(orientation.get('roll', 0.0))
-        
-        self.x_buffer.append(position.get('x', 0.0))
-        self.y_buffer.append(position.get('y', 0.0))
-        self.z_buffer.append(position.get('z', 0.0))
+        sample = (
+            time.monotonic() - self.start_time,
+            orientation.get('pitch', 0.0),
+            orientation.get('yaw', 0.0),
+            orientation.get('roll', 0.0),
+            position.get('x', 0.0),
+            position.get('y', 0.0),
+            position.get('z', 0.0),
+        )
+        self.data_buffer[:, self.buffer_index] = sample
+        self.data_buffer[:, self.buffer_index + self.max_data_points] = sample
+        self.buffer_index = (self.buffer_index + 1) % self.max_data_points
+        self.buffer_count = min(self.buffer_count + 1, self.max_data_points)
     
     def update_graphs(self):
         """
         Updates the graph plots with new data from buffers.
         """
-        if not self.time_buffer:
+        if not self.buffer_count or not self.isVisible():
             return
         
-        times = list(self.time_buffer)
+        if self.buffer_count < self.max_data_points:
+            data = self.data_buffer[:, :self.buffer_count]
+        else:
+            # Oldest sample sits at buffer_index; the mirrored half keeps this a view
+            data = self.data_buffer[:, self.buffer_index:self.buffer_index + self.max_data_points]
+        times = data[0]
         
-        self.pitch_curve.setData(times, list(self.pitch_buffer))
-        self.yaw_curve.setData(times, list(self.yaw_buffer))
-        self.roll_curve.setData(times, list(self.roll_buffer))
+        self.pitch_curve.setData(x=times, y=data[1])
+        self.yaw_curve.setData(x=times, y=data[2])
+        self.roll_curve.setData(x=times, y=data[3])
         
-        self.x_curve.setData(times, list(self.x_buffer))
-        self.y_curve.setData(times, list(self.y_buffer))
-        self.z_curve.setData(times, list(self.z_buffer))
\ No newline at end of file
+        self.x_curve.setData(x=times, y=data[4])
+        self.y_curve.setData(x=times, y=data[5])
+        self.z_curve.setData(x=times, y=data[6])
\ No newline at end of file
@@ -1,10 +1,33 @@
 from PyQt5.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QAction, QMessageBox
+from src.backend.telemetry_worker import TelemetryWorker
 from .mission_control_panel import MissionControlPanel
-from src.panda3d_render.rocket_view import RocketView
-from panda3d.core import loadPrcFileData
+from .rocket_view_widget import RocketViewWidget
 from .styles import MAIN_WINDOW_STYLE
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QTimer, QThread, QEvent, QMetaObject, Q_ARG, pyqtSlot
 import logging
+import time
+
+# Panda3D is still stepped this often when nothing has changed, so its internal tasks keep running
+RENDER_HEARTBEAT_INTERVAL = 0.5  # seconds
+
+# Input on the 3D view that should trigger a redraw
+SCENE_INTERACTION_EVENTS = (
+    QEvent.MouseButtonPress,
+    QEvent.MouseButtonRelease,
+    QEvent.MouseMove,
+    QEvent.Wheel,
+    QEvent.KeyPress,
+    QEvent.Resize,
+)
+
+# Example dummy telemetry, built once and shared by every read
+EXAMPLE_TELEMETRY = {
+    'altitude': 1000,
+    'velocity': 200,
+    'acceleration': 9.8,
+    'position': (0, 1000, 0),  # x, y, z
+    'orientation': (0, 0, 0),  # pitch, yaw, roll
+}
 
 class MainWindow(QMainWindow):
     """
@@ -17,15 +40,20 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         self.setStyleSheet(MAIN_WINDOW_STYLE)
         
-        # Configure Panda3D to use a child window
-        loadPrcFileData("", "window-type none")
+        # Set once initialize_rocket_view has created the Panda3D view
+        self.rocket_view = None
+        
+        # The 3D view is only re-rendered when telemetry or user input changed it
+        self._scene_dirty = True
+        self._last_render_step = 0.0
         
         self.init_ui()
         self.init_menu()
         self.show()
         
         # Initialize RocketView after the event loop has processed pending events
-        QTimer.singleShot(0, lambda: self.initialize_rocket_view(model_path=rocket_model_path))
+        QMetaObject.invokeMethod(self, "initialize_rocket_view", Qt.QueuedConnection,
+                                 Q_ARG(str, rocket_model_path or ""))
 
         # Set up a timer to update the 3D view
         self.render_timer = QTimer(self)
@@ -41,8 +69,10 @@ class MainWindow(QMainWindow):
         main_layout = QHBoxLayout()
         
         # Left pane: Rocket View
-        self.rocket_view_widget = QWidget()
+        self.rocket_view_widget = RocketViewWidget()
         self.rocket_view_widget.setMinimumSize(800, 600)  # Ensure the widget has a size
+        self.rocket_view_widget.installEventFilter(self)
+        self.rocket_view_widget.key_pressed.connect(self.forward_key)
         main_layout.addWidget(self.rocket_view_widget, 2)
         
         # Right pane: Dashboard and Controls
@@ -62,34 +92,76 @@ class MainWindow(QMainWindow):
         self.mission_control_panel.arm_system.connect(self.arm_system)
         self.mission_control_panel.disarm_system.connect(self.disarm_system)
         
-        # Set up a timer to update telemetry periodically
-        self.telemetry_timer = QTimer(self)
-        self.telemetry_timer.timeout.connect(self.update_telemetry)
-        self.telemetry_timer.start(1000)  # Update every 1000 ms (1 second)
+        # Telemetry is acquired on a worker thread and pushed to the GUI thread
+        self.telemetry_thread = QThread(self)
+        self.telemetry_worker = TelemetryWorker(self.read_telemetry, poll_interval=1.0)
+        self.telemetry_worker.moveToThread(self.telemetry_thread)
+        self.telemetry_worker.telemetry_ready.connect(self.update_telemetry, Qt.QueuedConnection)
+        self.telemetry_worker.finished.connect(self.telemetry_thread.quit)
+        self.telemetry_thread.started.connect(self.telemetry_worker.run)
+        self.telemetry_thread.start()
 
-    def initialize_rocket_view(self, model_path: str = None):
+    @pyqtSlot(str)
+    def initialize_rocket_view(self, model_path: str = ""):
         """
         Initializes the RocketView after the main window has been fully shown.
-        This ensures that the parent widget's window handle is valid.
+        An empty model_path means no rocket model.
         """
+        model_path = model_path or None
         try:
-            parent_handle = int(self.rocket_view_widget.winId())
-            logging.info(f"Initializing RocketView with parent_handle: {parent_handle}")
-            
-            self.rocket_view = RocketView(parent_handle=parent_handle)
+            # Panda3D is only imported once the window is up to keep startup fast
+            from src.panda3d_render.rocket_view import RocketView
+
+            # Panda3D renders offscreen and rocket_view_widget paints the frames it reads back
+            self.rocket_view = RocketView(model_path=model_path)
             logging.info("RocketView initialized successfully")
             
             # Force an update of the 3D view
-            self.rocket_view.taskMgr.step()
+            self.render_frame()
             logging.info("Initial render step completed")
         except Exception as e:
             logging.exception("Failed to initialize RocketView.")
             QMessageBox.critical(self, "Initialization Error", f"Failed to initialize RocketView:\n{e}")
             self.close()
 
+    @pyqtSlot()
     def update_3d_view(self):
-        if hasattr(self, 'rocket_view'):
-            self.rocket_view.taskMgr.step()
+        if self.rocket_view is None:
+            return
+        
+        now = time.monotonic()
+        if not self._scene_dirty and now - self._last_render_step < RENDER_HEARTBEAT_INTERVAL:
+            return
+        
+        self._scene_dirty = False
+        self._last_render_step = now
+        self.render_frame()
+
+    def render_frame(self):
+        """
+        Steps Panda3D once and shows the resulting offscreen frame.
+        """
+        self.rocket_view.taskMgr.step()
+        frame = self.rocket_view.get_frame()
+        if frame is not None:
+            self.rocket_view_widget.set_frame(*frame)
+
+    @pyqtSlot(str)
+    def forward_key(self, key: str):
+        if self.rocket_view is not None:
+            self.rocket_view.send_key(key)
+
+    def eventFilter(self, obj, event):
+        if obj is self.rocket_view_widget and event.type() in SCENE_INTERACTION_EVENTS:
+            self._scene_dirty = True
+        return super(MainWindow, self).eventFilter(obj, event)
+
+    def closeEvent(self, event):
+        # Let the worker finish its current receive before the window goes away
+        self.telemetry_worker.stop()
+        self.telemetry_thread.quit()
+        self.telemetry_thread.wait()
+        super(MainWindow, self).closeEvent(event)
 
     def init_menu(self):
         # Create menu bar
@@ -110,10 +182,12 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
 
+    @pyqtSlot()
     def show_about(self):
         QMessageBox.about(self, "About NovoGround GCS",
                           "NovoGround Ground Control System\nVersion 1.0\nDeveloped with PyQt and Panda3D.")
     
+    @pyqtSlot()
     def launch_mission(self):
         """
         Handles the launch mission action.
@@ -123,6 +197,7 @@ class MainWindow(QMainWindow):
         self.mission_control_panel.update_status("Launching")
         QMessageBox.information(self, "Mission Control", "Mission Launched.")
 
+    @pyqtSlot()
     def abort_mission(self):
         """
         Handles the abort mission action.
@@ -132,6 +207,7 @@ class MainWindow(QMainWindow):
         self.mission_control_panel.update_status("Aborting")
         QMessageBox.warning(self, "Mission Control", "Mission Aborted!")
 
+    @pyqtSlot()
     def arm_system(self):
         """
         Handles the arm system action.
@@ -141,6 +217,7 @@ class MainWindow(QMainWindow):
         self.mission_control_panel.update_status("Armed")
         QMessageBox.information(self, "Mission Control", "System Armed.")
 
+    @pyqtSlot()
     def disarm_system(self):
         """
         Handles the disarm system action.
@@ -150,21 +227,21 @@ class MainWindow(QMainWindow):
         self.mission_control_panel.update_status("Disarmed")
         QMessageBox.information(self, "Mission Control", "System Disarmed.")
     
-    def update_telemetry(self):
+    def read_telemetry(self):
         """
-        Updates telemetry in mission control panel with new data.
+        Fetches the next telemetry sample. Runs on the telemetry worker thread.
         """
         # Fetch the latest telemetry data from your backend
-        # Example dummy data
-        data = {
-            'altitude': 1000,
-            'velocity': 200,
-            'acceleration': 9.8,
-            'position': (0, 1000, 0),  # x, y, z
-            'orientation': (0, 0, 0),  # pitch, yaw, roll
-        }
+        return EXAMPLE_TELEMETRY
+
+    @pyqtSlot(dict)
+    def update_telemetry(self, data):
+        """
+        Updates telemetry in mission control panel with new data.
+        """
         self.mission_control_panel.update_telemetry(data)
         
         # Update the rocket view with new position and orientation if initialized
-        if hasattr(self, 'rocket_view'):
-            self.rocket_view.update_telemetry(data)
\ No newline at end of file
+        if self.rocket_view is not None:
+            self.rocket_view.update_telemetry(data)
+            self._scene_dirty = True
\ No newline at end of file
@@ -1,9 +1,17 @@
 from PyQt5.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, 
                              QGridLayout, QTabWidget, QTextEdit)
-from .styles import BUTTON_STYLE, LABEL_STYLE
-from pyqtgraph import PlotWidget, mkPen
-from PyQt5.QtCore import pyqtSignal
+from .styles import PANEL_STYLE, CONNECTED_LABEL_STYLE, DISCONNECTED_LABEL_STYLE
+from pyqtgraph import GraphicsLayoutWidget, mkPen
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtGui import QTextCursor
+from collections import deque
 import numpy as np
+import time
+
+# Room left past the newest sample when the graph X axis moves, as a fraction of the
+# plotted time span, and never less than GRAPH_MIN_HEADROOM seconds
+GRAPH_HEADROOM_FRACTION = 0.1
+GRAPH_MIN_HEADROOM = 1.0  # seconds
 
 class MissionControlPanel(QWidget):
     """
@@ -16,50 +24,70 @@ class MissionControlPanel(QWidget):
     arm_system = pyqtSignal()
     disarm_system = pyqtSignal()
     
+    # Secondary telemetry labels: (data key, label attribute, prefix, suffix)
+    SECONDARY_TELEMETRY_LABELS = (
+        ('rate_of_climb', 'rate_of_climb_label', "Rate of Climb/Descent: ", " m/s"),
+        ('barometric_altitude', 'barometric_altitude_label', "Barometric Altitude: ", " m"),
+        ('telemetry_latency', 'telemetry_latency_label', "Telemetry Latency: ", " ms"),
+        ('power_metrics', 'power_metrics_label', "Power Metrics: ", ""),
+        ('radio_metrics', 'radio_metrics_label', "Radio Metrics: ", ""),
+    )
+    
     def __init__(self, parent=None):
         super(MissionControlPanel, self).__init__(parent)
         self.max_data_points = 1000  # Adjust this value based on your needs
+        self.label_cache = {}  # Last text shown per label, to skip redundant setText calls
         self.init_ui()
+        self.init_graph_buffers()
     
     def init_ui(self):
+        self.setStyleSheet(PANEL_STYLE)
         main_layout = QVBoxLayout()
         
         # Add status label
         self.status_label = QLabel("Status: N/A")
-        self.status_label.setStyleSheet(LABEL_STYLE)
         main_layout.addWidget(self.status_label)
+        
+        # Add connectivity label
+        self.connected = None
+        self.connectivity_label = QLabel("Connectivity: N/A")
+        main_layout.addWidget(self.connectivity_label)
 
-        # Create tabs for main and secondary data
-        tab_widget = QTabWidget()
-        tab_widget.addTab(self.create_main_telemetry_tab(), "Main Telemetry")
-        tab_widget.addTab(self.create_secondary_telemetry_tab(), "Secondary Telemetry")
+        # Create tabs for main and secondary data. The secondary tab starts as an
+        # empty placeholder and is only filled in the first time it is opened.
+        self.tab_widget = QTabWidget()
+        self.tab_widget.addTab(self.create_main_telemetry_tab(), "Main Telemetry")
+        self.secondary_tab_built = False
+        self.secondary_tab_placeholder = QWidget()
+        secondary_layout = QVBoxLayout()
+        secondary_layout.setContentsMargins(0, 0, 0, 0)
+        self.secondary_tab_placeholder.setLayout(secondary_layout)
+        self.tab_widget.addTab(self.secondary_tab_placeholder, "Secondary Telemetry")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
-        main_layout.addWidget(tab_widget)
+        main_layout.addWidget(self.tab_widget)
         
         # Control buttons
         control_layout = QHBoxLayout()
         
         # Arm Button
         self.arm_button = QPushButton("Arm System")
-        self.arm_button.setStyleSheet(BUTTON_STYLE)
         self.arm_button.clicked.connect(self.arm_system.emit)
         control_layout.addWidget(self.arm_button)
         
         # Disarm Button
         self.disarm_button = QPushButton("Disarm System")
-        self.disarm_button.setStyleSheet(BUTTON_STYLE)
         self.disarm_button.clicked.connect(self.disarm_system.emit)
         control_layout.addWidget(self.disarm_button)
         
         # Launch Button
         self.launch_button = QPushButton("Launch Mission")
-        self.launch_button.setStyleSheet(BUTTON_STYLE)
         self.launch_button.clicked.connect(self.launch_mission.emit)
         control_layout.addWidget(self.launch_button)
         
         # Abort Button
         self.abort_button = QPushButton("Abort Mission")
-        self.abort_button.setStyleSheet(BUTTON_STYLE + "background-color: #ff4444;")
+        self.abort_button.setObjectName("abort_button")
         self.abort_button.clicked.connect(self.abort_mission.emit)
         control_layout.addWidget(self.abort_button)
         
@@ -76,34 +104,35 @@ class MissionControlPanel(QWidget):
         
         # Flight Phase Status
         self.flight_phase_label = QLabel("Flight Phase: N/A")
-        self.flight_phase_label.setStyleSheet(LABEL_STYLE)
         telemetry_grid.addWidget(self.flight_phase_label, 0, 0)
         
         # Motor Status
         self.motor_status_label = QLabel("Motor Status: N/A")
-        self.motor_status_label.setStyleSheet(LABEL_STYLE)
         telemetry_grid.addWidget(self.motor_status_label, 0, 1)
         
         # GPS Position
         self.gps_position_label = QLabel("GPS: N/A")
-        self.gps_position_label.setStyleSheet(LABEL_STYLE)
         telemetry_grid.addWidget(self.gps_position_label, 1, 0)
         
         # Battery Voltage
         self.battery_voltage_label = QLabel("Battery: N/A")
-        self.battery_voltage_label.setStyleSheet(LABEL_STYLE)
         telemetry_grid.addWidget(self.battery_voltage_label, 1, 1)
         
         layout.addLayout(telemetry_grid)
         
         # Graphs
-        self.altitude_graph = self.create_graph("Altitude (m)")
-        self.velocity_graph = self.create_graph("Vertical Velocity (m/s)")
-        self.acceleration_graph = self.create_graph("Acceleration (G)")
+        # One graphics scene holds all three plots, stacked with a shared time axis
+        self.graph_layout = GraphicsLayoutWidget()
+        self.graph_layout.setBackground('w')
+        self.altitude_graph = self.create_graph(0, "Altitude (m)")
+        self.velocity_graph = self.create_graph(1, "Vertical Velocity (m/s)")
+        self.acceleration_graph = self.create_graph(2, "Acceleration (G)")
+        
+        self.altitude_line = self.altitude_graph.plot(pen=mkPen('b', width=2), skipFiniteCheck=True)
+        self.velocity_line = self.velocity_graph.plot(pen=mkPen('b', width=2), skipFiniteCheck=True)
+        self.acceleration_line = self.acceleration_graph.plot(pen=mkPen('b', width=2), skipFiniteCheck=True)
         
-        layout.addWidget(self.altitude_graph)
-        layout.addWidget(self.velocity_graph)
-        layout.addWidget(self.acceleration_graph)
+        layout.addWidget(self.graph_layout)
         
         tab.setLayout(layout)
         return tab
@@ -135,20 +164,64 @@ class MissionControlPanel(QWidget):
         # System Logs
         self.system_logs = QTextEdit()
         self.system_logs.setReadOnly(True)
+        self.system_logs.document().setMaximumBlockCount(5000)
         layout.addWidget(QLabel("System Logs:"))
         layout.addWidget(self.system_logs)
 
         tab.setLayout(layout)
         return tab
 
-    def create_graph(self, title):
-        graph = PlotWidget(title=title)
-        graph.setBackground('w')
+    def create_graph(self, row, title):
+        graph = self.graph_layout.addPlot(row=row, col=0, title=title)
         graph.setLabel('left', title)
         graph.setLabel('bottom', 'Time (s)')
         graph.showGrid(x=True, y=True)
+        # Only draw samples inside the visible range; no downsampling pass per update
+        graph.setClipToView(True)
+        graph.setDownsampling(auto=False)
+        if row > 0:
+            graph.setXLink(self.altitude_graph)
         return graph
     
+    def init_graph_buffers(self):
+        # Samples waiting for the next flush: (time, altitude, velocity, acceleration)
+        self.pending_samples = deque(maxlen=self.max_data_points)
+        
+        # Shared ring buffer with one row per series. Each sample is written
+        # twice, N apart, so the latest N samples are always a contiguous view.
+        self.graph_data = np.zeros((4, 2 * self.max_data_points), dtype=np.float64)
+        self.graph_write_index = 0
+        self.graph_sample_count = 0
+        self.graph_x_right = None
+        self.start_time = None
+        
+        # All three graphs are redrawn together at a bounded rate
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self.flush_graphs)
+        self.flush_timer.start(100)
+        
+        # System log lines are appended in batches rather than one relayout per line
+        self.log_buffer = deque(maxlen=5000)
+        self.log_timer = QTimer(self)
+        self.log_timer.timeout.connect(self.flush_logs)
+        self.log_timer.start(250)
+    
+    @pyqtSlot(int)
+    def on_tab_changed(self, index):
+        """
+        Builds the secondary telemetry tab the first time it is shown.
+        
+        Args:
+            index (int): Index of the newly selected tab.
+        """
+        if self.secondary_tab_built or self.tab_widget.widget(index) is not self.secondary_tab_placeholder:
+            return
+        
+        self.secondary_tab_built = True
+        self.secondary_tab_placeholder.layout().addWidget(self.create_secondary_telemetry_tab())
+        self.flush_logs()
+    
+    @pyqtSlot(str)
     def update_status(self, status):
         """
         Updates the flight status indicator.
@@ -156,8 +229,9 @@ class MissionControlPanel(QWidget):
         Args:
             status (str): Current mission status.
         """
-        self.status_label.setText(f"Status: {status}")
+        self.set_label_text(self.status_label, f"Status: {status}")
     
+    @pyqtSlot(bool)
     def update_connectivity(self, connected):
         """
         Updates the connectivity indicator.
@@ -165,39 +239,112 @@ class MissionControlPanel(QWidget):
         Args:
             connected (bool): Connectivity status.
         """
+        # Restyling forces Qt to re-polish the label, so only do it on an actual change
+        if connected == self.connected:
+            return
+        self.connected = connected
+        
         status = "Connected" if connected else "Disconnected"
-        self.connectivity_label.setText(f"Connectivity: {status}")
+        self.set_label_text(self.connectivity_label, f"Connectivity: {status}")
+        self.connectivity_label.setStyleSheet(CONNECTED_LABEL_STYLE if connected else DISCONNECTED_LABEL_STYLE)
     
+    @pyqtSlot(dict)
     def update_telemetry(self, data):
         # Update main telemetry
         # ... existing code ...
 
+        # Queue graph samples; they are drawn on the next flush
+        if self.start_time is None:
+            self.start_time = time.monotonic()
+        self.pending_samples.append((
+            time.monotonic() - self.start_time,
+            data.get('altitude', 0.0),
+            data.get('velocity', 0.0),
+            data.get('acceleration', 0.0),
+        ))
+
         # Update secondary telemetry
-        self.rate_of_climb_label.setText(f"Rate of Climb/Descent: {data.get('rate_of_climb', 'N/A')} m/s")
-        self.barometric_altitude_label.setText(f"Barometric Altitude: {data.get('barometric_altitude', 'N/A')} m")
-        self.telemetry_latency_label.setText(f"Telemetry Latency: {data.get('telemetry_latency', 'N/A')} ms")
-        self.power_metrics_label.setText(f"Power Metrics: {data.get('power_metrics', 'N/A')}")
-        self.radio_metrics_label.setText(f"Radio Metrics: {data.get('radio_metrics', 'N/A')}")
+        if self.secondary_tab_built:
+            for key, label_name, prefix, suffix in self.SECONDARY_TELEMETRY_LABELS:
+                self.set_label_text(getattr(self, label_name), f"{prefix}{data.get(key, 'N/A')}{suffix}")
 
         # Update system logs
         if 'system_logs' in data:
-            self.system_logs.append(data['system_logs'])
+            self.log_buffer.append(data['system_logs'])
+
+    def set_label_text(self, label, text):
+        """
+        Sets a label's text, skipping the relayout when the text is unchanged.
+        
+        Args:
+            label (QLabel): Label to update.
+            text (str): New label text.
+        """
+        if self.label_cache.get(label) != text:
+            label.setText(text)
+            self.label_cache[label] = text
+
+    @pyqtSlot()
+    def flush_logs(self):
+        """
+        Appends all buffered system log lines in a single document edit.
+        """
+        if not self.log_buffer or not self.secondary_tab_built:
+            return
+
+        # Follow the tail like QTextEdit.append does, unless the user scrolled up
+        scrollbar = self.system_logs.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        cursor = self.system_logs.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.system_logs.document().isEmpty():
+            cursor.insertText("\n")
+        cursor.insertText("\n".join(self.log_buffer))
+        self.log_buffer.clear()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    @pyqtSlot()
+    def flush_graphs(self):
+        """
+        Drains queued samples into the shared ring buffer and redraws all graphs once.
+        """
+        if not self.pending_samples:
+            return
 
-    def update_graph(self, graph, x, y):
-        if not hasattr(graph, 'data_line'):
-            graph.data_line = graph.plot(pen=mkPen('b', width=2))
-            graph.data = {'x': np.zeros(self.max_data_points), 'y': np.zeros(self.max_data_points)}
+        samples = np.array(self.pending_samples, dtype=np.float64).T
+        self.pending_samples.clear()
 
-        # Roll the data arrays to make room for new data
-        graph.data['x'] = np.roll(graph.data['x'], -1)
-        graph.data['y'] = np.roll(graph.data['y'], -1)
+        # Write the batch (and its mirror) into the ring
+        count = samples.shape[1]
+        indices = (self.graph_write_index + np.arange(count)) % self.max_data_points
+        self.graph_data[:, indices] = samples
+        self.graph_data[:, indices + self.max_data_points] = samples
+        self.graph_write_index = (self.graph_write_index + count) % self.max_data_points
+        self.graph_sample_count = min(self.graph_sample_count + count, self.max_data_points)
 
-        # Add new data point
-        graph.data['x'][-1] = x
-        graph.data['y'][-1] = y
+        if self.graph_sample_count < self.max_data_points:
+            data = self.graph_data[:, :self.graph_sample_count]
+        else:
+            data = self.graph_data[:, self.graph_write_index:self.graph_write_index + self.max_data_points]
+        times = data[0]
 
-        # Update the plot data
-        graph.data_line.setData(graph.data['x'], graph.data['y'])
+        # Only move the X axis once the data runs past the current right edge,
+        # leaving some headroom so this happens every few samples instead of every one.
+        # Sample times are in seconds, so the window is the time span the buffered samples cover.
+        x = times[-1]
+        move_x_range = self.graph_x_right is None or x > self.graph_x_right
+        if move_x_range:
+            headroom = max((x - times[0]) * GRAPH_HEADROOM_FRACTION, GRAPH_MIN_HEADROOM)
+            self.graph_x_right = x + headroom
 
-        # Adjust X axis range to show all data
-        graph.setXRange(max(0, x - self.max_data_points), x)
\ No newline at end of file
+        self.graph_layout.setUpdatesEnabled(False)
+        self.altitude_line.setData(times, data[1], skipFiniteCheck=True)
+        self.velocity_line.setData(times, data[2], skipFiniteCheck=True)
+        self.acceleration_line.setData(times, data[3], skipFiniteCheck=True)
+        if move_x_range:
+            # The other plots follow through their X link
+            self.altitude_graph.setXRange(times[0], self.graph_x_right)
+        self.graph_layout.setUpdatesEnabled(True)
\ No newline at end of file
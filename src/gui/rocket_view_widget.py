@@ -0,0 +1,52 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtCore import Qt, pyqtSignal
+
+# Qt keys forwarded to Panda3D under the names RocketView listens for
+PANDA_KEY_NAMES = {
+    Qt.Key_A: "a",
+    Qt.Key_D: "d",
+    Qt.Key_W: "w",
+    Qt.Key_S: "s",
+    Qt.Key_Up: "arrow_up",
+    Qt.Key_Down: "arrow_down",
+    Qt.Key_Left: "arrow_left",
+    Qt.Key_Right: "arrow_right",
+}
+
+class RocketViewWidget(QWidget):
+    """
+    Displays frames rendered offscreen by RocketView and forwards keyboard input back to it.
+    """
+    key_pressed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super(RocketViewWidget, self).__init__(parent)
+        self.frame = QImage()
+        self.setFocusPolicy(Qt.StrongFocus)
+        # Every pixel is painted by paintEvent, so Qt does not need to clear the background
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def set_frame(self, data: bytes, width: int, height: int):
+        """
+        Takes an RGBA frame with the bottom row first, as Panda3D stores textures, and schedules a repaint.
+        """
+        image = QImage(data, width, height, width * 4, QImage.Format_RGBA8888)
+        # mirrored() returns a deep copy, so the image no longer references data
+        self.frame = image.mirrored()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.frame.isNull():
+            painter.fillRect(self.rect(), Qt.black)
+        else:
+            painter.drawImage(self.rect(), self.frame)
+        painter.end()
+
+    def keyPressEvent(self, event):
+        key = PANDA_KEY_NAMES.get(event.key())
+        if key is None:
+            super(RocketViewWidget, self).keyPressEvent(event)
+            return
+        self.key_pressed.emit(key)
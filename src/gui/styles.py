@@ -8,6 +8,9 @@ BUTTON_HOVER_COLOR = "#555555"
 BUTTON_PRESS_COLOR = "#1E1E1E"
 GAUGE_COLOR = "#4CAF50"
 GRAPH_BG_COLOR = "#3C3C3C"
+ABORT_BUTTON_COLOR = "#ff4444"
+CONNECTED_COLOR = "#4CAF50"
+DISCONNECTED_COLOR = "#ff4444"
 
 # Fonts
 DEFAULT_FONT = "Arial"
@@ -43,15 +46,6 @@ BUTTON_STYLE = f"""
     }}
 """
 
-LCD_NUMBER_STYLE = f"""
-    QLCDNumber {{
-        background-color: {BACKGROUND_COLOR};
-        color: {TEXT_COLOR};
-        border: 1px solid {TEXT_COLOR};
-        font: 16px {LCD_FONT};
-    }}
-"""
-
 LABEL_STYLE = f"""
     QLabel {{
         color: {TEXT_COLOR};
@@ -59,20 +53,28 @@ LABEL_STYLE = f"""
     }}
 """
 
-GAUGE_STYLE = f"""
-    QProgressBar {{
-        border: 1px solid {TEXT_COLOR};
-        text-align: center;
-        color: {TEXT_COLOR};
-        font: 12px {DEFAULT_FONT};
+GRAPH_STYLE = f"""
+    QWidget {{
+        background-color: {GRAPH_BG_COLOR};
     }}
-    QProgressBar::chunk {{
-        background-color: {GAUGE_COLOR};
+"""
+
+# Applied once to MissionControlPanel; child buttons and labels pick it up through the cascade
+PANEL_STYLE = BUTTON_STYLE + LABEL_STYLE + f"""
+    QPushButton#abort_button {{
+        background-color: {ABORT_BUTTON_COLOR};
     }}
 """
 
-GRAPH_STYLE = f"""
-    QWidget {{
-        background-color: {GRAPH_BG_COLOR};
+# Connectivity indicator styles, kept as fixed strings so Qt can reuse the parsed sheets
+CONNECTED_LABEL_STYLE = f"""
+    QLabel {{
+        color: {CONNECTED_COLOR};
+    }}
+"""
+
+DISCONNECTED_LABEL_STYLE = f"""
+    QLabel {{
+        color: {DISCONNECTED_COLOR};
     }}
 """
\ No newline at end of file
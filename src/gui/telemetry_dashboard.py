@@ -1,93 +1,193 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QLCDNumber, QProgressBar
-from .styles import LCD_NUMBER_STYLE, LABEL_STYLE, GAUGE_STYLE
-from PyQt5.QtCore import pyqtSlot
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QColor, QFont, QPainter, QStaticText, QTransform
+from .styles import BACKGROUND_COLOR, TEXT_COLOR, GAUGE_COLOR, DEFAULT_FONT, LCD_FONT
+from PyQt5.QtCore import Qt, QRectF, QTimer, pyqtSlot
+from contextlib import contextmanager
+
+# Smallest change in a displayed value that is worth a repaint
+DISPLAY_EPSILON = 1e-4
+
+# Telemetry arriving faster than this is coalesced into one repaint (~60 Hz)
+REFRESH_INTERVAL_MS = 16
+
+# Dashboard sections: title, telemetry key, and (readout name, field) per row
+SECTIONS = (
+    ("Orientation (Pitch, Yaw, Roll)", 'orientation', (('Pitch', 'pitch'), ('Yaw', 'yaw'), ('Roll', 'roll'))),
+    ("Position (X, Y, Z)", 'position', (('X', 'x'), ('Y', 'y'), ('Z', 'z'))),
+)
+
+# Layout metrics in pixels
+ROW_HEIGHT = 32
+TITLE_HEIGHT = 24
+MARGIN = 8
+NAME_WIDTH = 48
 
 class TelemetryDashboard(QWidget):
     """
     TelemetryDashboard class inheriting from QWidget.
     Displays real-time telemetry data in numerical and graphical formats.
+    All readouts and the health bar are drawn in a single paintEvent.
     """
     def __init__(self, parent=None):
         super(TelemetryDashboard, self).__init__(parent)
+        self.batch_depth = 0  # Nesting level of batch_updates
+        self.pending_data = None  # Latest telemetry not yet displayed
+        self.flush_armed = False
         self.init_ui()
-    
+
     def init_ui(self):
-        layout = QVBoxLayout()
-        
-        # Orientation Display
-        orientation_label = QLabel("Orientation (Pitch, Yaw, Roll)")
-        orientation_label.setStyleSheet(LABEL_STYLE)
-        layout.addWidget(orientation_label)
-        
-        self.pitch_display = QLCDNumber()
-        self.pitch_display.setStyleSheet(LCD_NUMBER_STYLE)
-        self.pitch_display.setDigitCount(5)
-        layout.addWidget(self.pitch_display)
-        
-        self.yaw_display = QLCDNumber()
-        self.yaw_display.setStyleSheet(LCD_NUMBER_STYLE)
-        self.yaw_display.setDigitCount(5)
-        layout.addWidget(self.yaw_display)
-        
-        self.roll_display = QLCDNumber()
-        self.roll_display.setStyleSheet(LCD_NUMBER_STYLE)
-        self.roll_display.setDigitCount(5)
-        layout.addWidget(self.roll_display)
-        
-        # Position Display
-        position_label = QLabel("Position (X, Y, Z)")
-        position_label.setStyleSheet(LABEL_STYLE)
-        layout.addWidget(position_label)
-        
-        self.x_display = QLCDNumber()
-        self.x_display.setStyleSheet(LCD_NUMBER_STYLE)
-        self.x_display.setDigitCount(7)
-        layout.addWidget(self.x_display)
-        
-        self.y_display = QLCDNumber()
-        self.y_display.setStyleSheet(LCD_NUMBER_STYLE)
-        self.y_display.setDigitCount(7)
-        layout.addWidget(self.y_display)
-        
-        self.z_display = QLCDNumber()
-        self.z_display.setStyleSheet(LCD_NUMBER_STYLE)
-        self.z_display.setDigitCount(7)
-        layout.addWidget(self.z_display)
-        
-        # Health Indicators (Example)
-        health_label = QLabel("System Health")
-        health_label.setStyleSheet(LABEL_STYLE)
-        layout.addWidget(health_label)
-        
-        self.health_bar = QProgressBar()
-        self.health_bar.setStyleSheet(GAUGE_STYLE)
-        self.health_bar.setMaximum(100)
-        self.health_bar.setValue(100)
-        layout.addWidget(self.health_bar)
-        
-        self.setLayout(layout)
-    
+        self.background_color = QColor(BACKGROUND_COLOR)
+        self.text_color = QColor(TEXT_COLOR)
+        self.gauge_color = QColor(GAUGE_COLOR)
+        self.label_font = QFont(DEFAULT_FONT)
+        self.label_font.setPixelSize(14)
+        self.value_font = QFont(LCD_FONT)
+        self.value_font.setPixelSize(16)
+        self.gauge_font = QFont(DEFAULT_FONT)
+        self.gauge_font.setPixelSize(12)
+
+        # QStaticText keeps its text layout until the text changes, so unchanged readouts cost no layout
+        self.titles = [QStaticText(title) for title, _, _ in SECTIONS]
+        self.titles.append(QStaticText("System Health"))
+        self.names = {}
+        self.values = {}
+        self.value_texts = {}
+        for _, _, readouts in SECTIONS:
+            for name, _ in readouts:
+                self.names[name] = QStaticText(name)
+                self.values[name] = 0.0
+                self.value_texts[name] = self.static_text(self.format_value(0.0), self.value_font)
+        self.health = 100
+        self.health_text = self.static_text("100%", self.gauge_font)
+
+        rows = sum(len(readouts) for _, _, readouts in SECTIONS) + 1
+        self.setMinimumHeight(len(self.titles) * TITLE_HEIGHT + rows * ROW_HEIGHT + 2 * MARGIN)
+        # paintEvent fills the whole widget itself
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    @staticmethod
+    def format_value(value):
+        return f"{value:.2f}"
+
+    @staticmethod
+    def static_text(text, font):
+        """
+        Creates a QStaticText laid out for font up front, so its size is known before the first paint.
+        """
+        static_text = QStaticText(text)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
     @pyqtSlot(dict)
     def update_telemetry(self, data):
         """
-        Slot to receive and display telemetry data.
-        
+        Slot to receive telemetry data. Only the latest sample is displayed once
+        the refresh interval elapses, so paints are capped regardless of the producer rate.
+
         Args:
             data (dict): Telemetry data containing orientation and position.
         """
-        orientation = data.get('orientation', {})
-        position = data.get('position', {})
+        self.pending_data = data
+        # Inside batch_updates the flush happens when the outermost batch exits
+        if self.batch_depth == 0 and not self.flush_armed:
+            self.flush_armed = True
+            QTimer.singleShot(REFRESH_INTERVAL_MS, self.flush_telemetry)
+
+    @pyqtSlot()
+    def flush_telemetry(self):
+        """
+        Displays the most recent telemetry sample.
+        """
+        self.flush_armed = False
+        # Nothing new since the last flush, or a batch is open and will flush when it exits
+        if self.pending_data is None or self.batch_depth:
+            return
+        data = self.pending_data
+        self.pending_data = None
+
+        changed = False
+        for _, key, readouts in SECTIONS:
+            group = data.get(key, {})
+            for name, field in readouts:
+                changed |= self.set_value(name, group.get(field, 0.0))
+
         health = data.get('health', 100)
-        
-        # Update orientation displays
-        self.pitch_display.display(orientation.get('pitch', 0.0))
-        self.yaw_display.display(orientation.get('yaw', 0.0))
-        self.roll_display.display(orientation.get('roll', 0.0))
-        
-        # Update position displays
-        self.x_display.display(position.get('x', 0.0))
-        self.y_display.display(position.get('y', 0.0))
-        self.z_display.display(position.get('z', 0.0))
-        
-        # Update health indicator
-        self.health_bar.setValue(health)
\ No newline at end of file
+        if health != self.health:
+            self.health = health
+            self.health_text.setText(f"{health}%")
+            self.health_text.prepare(QTransform(), self.gauge_font)
+            changed = True
+
+        # update() coalesces into one paint
+        if changed:
+            self.update()
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Holds back displaying telemetry until the outermost batch exits, then shows the
+        latest sample with a single flush. Batches may be nested, so callers merging
+        several telemetry packets can wrap them all.
+        """
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0:
+                self.flush_telemetry()
+
+    def set_value(self, name, value):
+        """
+        Stores a readout value, skipping it when it has not visibly changed.
+
+        Args:
+            name (str): Readout name.
+            value (float): New value.
+
+        Returns:
+            bool: Whether the readout needs repainting.
+        """
+        if abs(value - self.values[name]) <= DISPLAY_EPSILON:
+            return False
+        self.values[name] = value
+        value_text = self.value_texts[name]
+        value_text.setText(self.format_value(value))
+        value_text.prepare(QTransform(), self.value_font)
+        return True
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background_color)
+        painter.setPen(self.text_color)
+
+        width = self.width() - 2 * MARGIN
+        y = MARGIN
+        for title, (_, _, readouts) in zip(self.titles, SECTIONS):
+            painter.setFont(self.label_font)
+            painter.drawStaticText(MARGIN, y, title)
+            y += TITLE_HEIGHT
+            for name, _ in readouts:
+                painter.setFont(self.label_font)
+                painter.drawStaticText(MARGIN, y + 6, self.names[name])
+                box = QRectF(MARGIN + NAME_WIDTH, y, width - NAME_WIDTH, ROW_HEIGHT - 4)
+                painter.drawRect(box)
+                painter.setFont(self.value_font)
+                value_text = self.value_texts[name]
+                painter.drawStaticText(int(box.right() - value_text.size().width() - 6), y + 4, value_text)
+                y += ROW_HEIGHT
+
+        # Health bar
+        painter.setFont(self.label_font)
+        painter.drawStaticText(MARGIN, y, self.titles[-1])
+        y += TITLE_HEIGHT
+        bar = QRectF(MARGIN, y, width, ROW_HEIGHT - 8)
+        fill = QRectF(bar)
+        fill.setWidth(bar.width() * max(0, min(self.health, 100)) / 100)
+        painter.fillRect(fill, self.gauge_color)
+        painter.drawRect(bar)
+        painter.setFont(self.gauge_font)
+        text_size = self.health_text.size()
+        painter.drawStaticText(int(bar.center().x() - text_size.width() / 2),
+                               int(bar.center().y() - text_size.height() / 2), self.health_text)
+        painter.end()
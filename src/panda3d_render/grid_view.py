@@ -1,6 +1,46 @@
-from panda3d.core import LineSegs, NodePath, Vec3, TextNode
+from panda3d.core import NodePath, Vec3, TextNode
+from panda3d.core import Geom, GeomLines, GeomNode, GeomVertexData, GeomVertexFormat, GeomVertexWriter
 import logging
 
+# Corners of a unit cube centred on the origin
+CUBE_UNIT_VERTICES = (
+    (-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5),
+    (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5),
+)
+
+# Cube edges as pairs of indices into CUBE_UNIT_VERTICES
+CUBE_EDGES = (
+    (0, 1), (1, 2), (2, 3), (3, 0),  # Bottom edges
+    (4, 5), (5, 6), (6, 7), (7, 4),  # Top edges
+    (0, 4), (1, 5), (2, 6), (3, 7),  # Vertical edges
+)
+
+# Axis colors for X, Y and Z
+AXIS_COLORS = ((1, 0, 0, 1), (0, 1, 0, 1), (0, 0, 1, 1))
+
+def create_lines_node(name: str, vertices, colors, edges) -> GeomNode:
+    """
+    Builds a GeomNode drawing all edges as one GeomLines primitive over a shared vertex buffer.
+    """
+    vertex_data = GeomVertexData(name, GeomVertexFormat.get_v3c4(), Geom.UH_static)
+    vertex_data.set_num_rows(len(vertices))
+    vertex_writer = GeomVertexWriter(vertex_data, 'vertex')
+    color_writer = GeomVertexWriter(vertex_data, 'color')
+    for vertex, color in zip(vertices, colors):
+        vertex_writer.add_data3(*vertex)
+        color_writer.add_data4(*color)
+
+    primitive = GeomLines(Geom.UH_static)
+    for start, end in edges:
+        primitive.add_vertices(start, end)
+    primitive.close_primitive()
+
+    geom = Geom(vertex_data)
+    geom.add_primitive(primitive)
+    node = GeomNode(name)
+    node.add_geom(geom)
+    return node
+
 class GridView:
     """
     Renders a 3D environment including a wireframe cube and coordinate axes to simulate an immersive environment.
@@ -13,6 +53,7 @@ class GridView:
         self.color = color
         self.node = NodePath("3D_Environment")
         self.node.reparent_to(self.parent)
+        self.axis_labels = []
         
         self._create_cube_grid()
         self._create_coordinate_axes()
@@ -26,35 +67,12 @@ class GridView:
         """
         cube_size = self.grid_size * self.spacing  # Define cube size based on grid_size and spacing
 
-        # Define cube vertices
-        vertices = [
-            Vec3(-cube_size/2, -cube_size/2, -cube_size/2),
-            Vec3(cube_size/2, -cube_size/2, -cube_size/2),
-            Vec3(cube_size/2, cube_size/2, -cube_size/2),
-            Vec3(-cube_size/2, cube_size/2, -cube_size/2),
-            Vec3(-cube_size/2, -cube_size/2, cube_size/2),
-            Vec3(cube_size/2, -cube_size/2, cube_size/2),
-            Vec3(cube_size/2, cube_size/2, cube_size/2),
-            Vec3(-cube_size/2, cube_size/2, cube_size/2)
-        ]
+        # Scale the unit cube once and upload all 12 edges as a single line primitive
+        vertices = [(x * cube_size, y * cube_size, z * cube_size) for x, y, z in CUBE_UNIT_VERTICES]
+        cube_node = self.node.attach_new_node(
+            create_lines_node("cube_grid", vertices, (self.color,) * len(vertices), CUBE_EDGES))
+        cube_node.set_render_mode_thickness(1)
 
-        # Define cube edges (pairs of indices)
-        edges = [
-            (0, 1), (1, 2), (2, 3), (3, 0),  # Bottom edges
-            (4, 5), (5, 6), (6, 7), (7, 4),  # Top edges
-            (0, 4), (1, 5), (2, 6), (3, 7)   # Vertical edges
-        ]
-
-        # Create LineSegs for cube edges
-        lines = LineSegs()
-        lines.set_color(*self.color)
-        lines.set_thickness(1)
-
-        for edge in edges:
-            lines.move_to(vertices[edge[0]])
-            lines.draw_to(vertices[edge[1]])
-
-        cube_node = self.node.attach_new_node(lines.create())
         logging.info(f"Cube grid created with size {cube_size} units.")
 
     def _create_coordinate_axes(self):
@@ -63,25 +81,14 @@ class GridView:
         """
         axis_length = self.grid_size * self.spacing / 4  # 1/4 of the cube size
         
-        lines = LineSegs()
-        lines.set_thickness(3)
-
-        # X-axis (red)
-        lines.set_color(1, 0, 0, 1)
-        lines.move_to(0, 0, 0)
-        lines.draw_to(axis_length, 0, 0)
-
-        # Y-axis (green)
-        lines.set_color(0, 1, 0, 1)
-        lines.move_to(0, 0, 0)
-        lines.draw_to(0, axis_length, 0)
-
-        # Z-axis (blue)
-        lines.set_color(0, 0, 1, 1)
-        lines.move_to(0, 0, 0)
-        lines.draw_to(0, 0, axis_length)
-
-        axis_node = self.node.attach_new_node(lines.create())
+        # Each axis runs from its own origin vertex so it keeps a single color
+        vertices = ((0, 0, 0), (axis_length, 0, 0),
+                    (0, 0, 0), (0, axis_length, 0),
+                    (0, 0, 0), (0, 0, axis_length))
+        colors = [color for color in AXIS_COLORS for _ in range(2)]
+        axis_node = self.node.attach_new_node(
+            create_lines_node("coordinate_axes", vertices, colors, ((0, 1), (2, 3), (4, 5))))
+        axis_node.set_render_mode_thickness(3)
         axis_node.set_light_off()
 
         # Add labels to the axes
@@ -102,4 +109,6 @@ class GridView:
         label_np.set_pos(position)
         label_np.set_scale(5)  # Adjust scale as needed
         label_np.set_light_off()
-        label_np.set_billboard_point_eye()
\ No newline at end of file
+        # Text faces -Y, toward the default camera; a fixed orientation avoids per-frame billboard transforms
+        label_np.set_two_sided(True)
+        self.axis_labels.append(label_np)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from panda3d.core import WindowProperties, PerspectiveLens, Vec3, NodePath, AmbientLight, DirectionalLight
+from panda3d.core import GraphicsOutput, Texture
 from direct.showbase.ShowBase import ShowBase
 from panda3d.core import loadPrcFileData
 from .shaders import ShaderProgram
@@ -7,6 +8,18 @@ from direct.task import Task
 import logging
 import sys
 
+# Model manipulation per input action; each entry takes the rocket NodePath
+KEY_ACTIONS = {
+    "rotate_left": lambda rocket: rocket.set_h(rocket.get_h() + 5),
+    "rotate_right": lambda rocket: rocket.set_h(rocket.get_h() - 5),
+    "rotate_up": lambda rocket: rocket.set_p(rocket.get_p() + 5),
+    "rotate_down": lambda rocket: rocket.set_p(rocket.get_p() - 5),
+    "translate_forward": lambda rocket: rocket.set_y(rocket, 1),
+    "translate_backward": lambda rocket: rocket.set_y(rocket, -1),
+    "translate_left": lambda rocket: rocket.set_x(rocket, -1),
+    "translate_right": lambda rocket: rocket.set_x(rocket, 1),
+}
+
 class RocketGroup(NodePath):
     """
     Custom rendering group that manages shader program usage and model matrix
@@ -19,12 +32,10 @@ class RocketGroup(NodePath):
 
     def set_shader(self, shader: ShaderProgram):
         """
-        Sets the shader program for the group and all its children.
+        Sets the shader program for the group. Children inherit it through the scene graph.
         """
         self.shader_program = shader
         super().set_shader(shader.get_shader())  # Correctly call superclass method
-        for child in self.get_children():
-            child.set_shader(shader.get_shader())
 
 class RocketView(ShowBase):
     """
@@ -34,28 +45,46 @@ class RocketView(ShowBase):
     and model transformation updates based on telemetry data.
     """
 
-    def __init__(self, parent_handle, model_path: str = None):
-        # Ensure parent_handle is an integer
-        if not isinstance(parent_handle, int):
-            raise TypeError("parent_handle must be an integer.")
-        
-        # Initialize Panda3D without creating a new window
-        loadPrcFileData("", "window-type none")
-        super().__init__(windowType="none")
-        logging.info("Panda3D ShowBase initialized with windowType='none'")
-
-        # Open a new window embedded in the Qt widget
-        props = WindowProperties()
-        props.set_parent_window(parent_handle)  # Now correctly receives an int
-        props.set_title("3D Rocket Visualization")
-        props.set_size(800, 600)  # Adjust size as needed
-        try:
-            self.open_window(props=props)
-            logging.info("Panda3D window opened successfully with parent_handle.")
-        except Exception as e:
-            logging.exception("Failed to open Panda3D window.")
-            raise
-        
+    def __init__(self, parent_handle: int = None, model_path: str = None, size: tuple = (800, 600)):
+        """
+        :param parent_handle: Native window to embed the Panda3D window in. When None, the scene is
+            rendered to an offscreen buffer and each frame is read back with get_frame().
+        :param size: Width and height of the render target.
+        """
+        width, height = size
+        self.frame_texture = None
+
+        if parent_handle is None:
+            # Render into an offscreen buffer; the host widget blits the result itself
+            loadPrcFileData("", "window-type offscreen")
+            loadPrcFileData("", f"win-size {width} {height}")
+            super().__init__(windowType="offscreen")
+            logging.info("Panda3D ShowBase initialized with windowType='offscreen'")
+
+            self.frame_texture = Texture("rocket_view_frame")
+            self.win.add_render_texture(self.frame_texture, GraphicsOutput.RTM_copy_ram)
+        else:
+            # Ensure parent_handle is an integer
+            if not isinstance(parent_handle, int):
+                raise TypeError("parent_handle must be an integer.")
+
+            # Initialize Panda3D without creating a new window
+            loadPrcFileData("", "window-type none")
+            super().__init__(windowType="none")
+            logging.info("Panda3D ShowBase initialized with windowType='none'")
+
+            # Open a new window embedded in the Qt widget
+            props = WindowProperties()
+            props.set_parent_window(parent_handle)  # Now correctly receives an int
+            props.set_title("3D Rocket Visualization")
+            props.set_size(width, height)
+            try:
+                self.open_window(props=props)
+                logging.info("Panda3D window opened successfully with parent_handle.")
+            except Exception as e:
+                logging.exception("Failed to open Panda3D window.")
+                raise
+
         # Disable default camera controls
         self.disable_mouse()
         logging.info("Default camera controls disabled.")
@@ -76,9 +105,16 @@ class RocketView(ShowBase):
         self.grid = GridView(self.render)
         logging.info("GridView (3D Environment) initialized and added to render")
 
-        # Load rocket model if model_path is provided
-        if model_path:
-            self.rocket = self._load_model(model_path)
+        # Last transform applied from telemetry, to skip rewriting an unchanged transform
+        self.last_position = None
+        self.last_orientation = None
+
+        # Reused by get_telemetry_data every frame instead of building a new dict and vectors
+        self.telemetry_buffer = {'position': Vec3(0, 0, 0), 'orientation': Vec3(0, 0, 0)}
+
+        # Load rocket model if model_path is provided; a model that fails to load is skipped
+        self.rocket = self._load_model(model_path) if model_path else None
+        if self.rocket is not None:
             self.rocket.reparent_to(self.render)
             logging.info("Rocket model loaded and reparented to render.")
 
@@ -86,8 +122,7 @@ class RocketView(ShowBase):
             self.rocket.set_shader(self.basic_shader.get_shader())
             logging.info("Shader applied to rocket model.")
         else:
-            self.rocket = None
-            logging.info("No rocket model file provided. Skipping rocket loading.")
+            logging.info("No rocket model loaded. The view shows only the grid.")
 
         # User input keys
         self.keys = {
@@ -141,10 +176,15 @@ class RocketView(ShowBase):
     def _load_model(self, model_path: str) -> NodePath:
         """
         Loads a 3D model from the given path.
+        Returns None if the model cannot be loaded, so a missing file does not stop the application.
         """
-        model = self.loader.loadModel(model_path)
-        if not model:
-            self.exit_with_error(f"Failed to load model: {model_path}")
+        try:
+            model = self.loader.loadModel(model_path)
+        except OSError:
+            model = None
+        if model is None or model.is_empty():
+            logging.warning(f"Failed to load model: {model_path}. Continuing without it.")
+            return None
         logging.info(f"Model loaded from {model_path}")
         return model
 
@@ -164,49 +204,66 @@ class RocketView(ShowBase):
             logging.warning("Rocket model is not loaded. Ignoring input.")
             return
 
-        if action == "rotate_left":
-            self.rocket.set_h(self.rocket.get_h() + 5)
-        elif action == "rotate_right":
-            self.rocket.set_h(self.rocket.get_h() - 5)
-        elif action == "rotate_up":
-            self.rocket.set_p(self.rocket.get_p() + 5)
-        elif action == "rotate_down":
-            self.rocket.set_p(self.rocket.get_p() - 5)
-        elif action == "translate_forward":
-            self.rocket.set_y(self.rocket, 1)
-        elif action == "translate_backward":
-            self.rocket.set_y(self.rocket, -1)
-        elif action == "translate_left":
-            self.rocket.set_x(self.rocket, -1)
-        elif action == "translate_right":
-            self.rocket.set_x(self.rocket, 1)
-        logging.info(f"Action performed: {action}")
+        move = KEY_ACTIONS.get(action)
+        if move is None:
+            return
+        move(self.rocket)
+        # The model moved outside telemetry, so the next sample must be applied again
+        self.last_position = None
+        self.last_orientation = None
+        logging.debug("Action performed: %s", action)
+
+    def get_frame(self):
+        """
+        Returns the last offscreen frame as (rgba_bytes, width, height), bottom row first,
+        or None when rendering to a window or before the first frame.
+        """
+        texture = self.frame_texture
+        if texture is None or not texture.has_ram_image():
+            return None
+        return bytes(texture.get_ram_image_as("RGBA")), texture.get_x_size(), texture.get_y_size()
+
+    def send_key(self, key: str):
+        """
+        Forwards a key press from the host toolkit; an offscreen buffer receives no input of its own.
+        """
+        self.messenger.send(key)
 
     def update_telemetry(self, task: Task) -> Task:
         """
         Updates the rocket model's transformation based on telemetry data.
         Placeholder for telemetry integration.
         """
+        if self.rocket is None:
+            return Task.cont
+
         # Example telemetry data updates (to be replaced with actual data)
         telemetry_data = self.get_telemetry_data()
-        if telemetry_data and self.rocket:
-            position = telemetry_data.get('position', self.rocket.get_pos())
-            orientation = telemetry_data.get('orientation', self.rocket.get_hpr())
-            self.rocket.set_pos(position)
-            self.rocket.set_hpr(orientation)
-            logging.info(f"Telemetry updated: Position={position}, Orientation={orientation}")
+        if telemetry_data:
+            position = telemetry_data.get('position', self.last_position)
+            orientation = telemetry_data.get('orientation', self.last_orientation)
+            # Writing a transform invalidates the node's cached state, so only write real changes
+            if position is not None and (self.last_position is None or position != self.last_position):
+                self.rocket.set_pos(position)
+                self.last_position = Vec3(*position)
+            if orientation is not None and (self.last_orientation is None or orientation != self.last_orientation):
+                self.rocket.set_hpr(orientation)
+                self.last_orientation = Vec3(*orientation)
+            # Runs every frame, so the message is only formatted when DEBUG is enabled
+            logging.debug("Telemetry updated: Position=%s, Orientation=%s", position, orientation)
         return Task.cont
 
     def get_telemetry_data(self) -> dict:
         """
         Retrieves telemetry data for updating the rocket model.
-        Placeholder implementation.
+        Placeholder implementation. The same dictionary is returned and updated in place on every call.
         """
         # Replace with actual telemetry data retrieval
-        return {
-            'position': self.rocket.get_pos() if self.rocket else Vec3(0, 0, 0),
-            'orientation': self.rocket.get_hpr() if self.rocket else Vec3(0, 0, 0)
-        }
+        telemetry = self.telemetry_buffer
+        if self.rocket is not None:
+            telemetry['position'].assign(self.rocket.get_pos())
+            telemetry['orientation'].assign(self.rocket.get_hpr())
+        return telemetry
 
     def exit_with_error(self, message: str):
         """
@@ -1,5 +1,8 @@
 from panda3d.core import Shader
 
+# Compiled shaders keyed by (vertex file, fragment file), shared by every ShaderProgram
+_shader_cache = {}
+
 class ShaderProgram:
     """
     Manages the compilation and linking of vertex and fragment shaders.
@@ -14,15 +17,22 @@ class ShaderProgram:
 
     def _load_shader(self) -> Shader:
         """
-        Loads and compiles the vertex and fragment shaders.
+        Loads and compiles the vertex and fragment shaders, reusing the compiled shader
+        when the same pair was loaded before.
         Raises an exception if shader compilation or linking fails.
         """
+        key = (self.vertex_shader_file, self.fragment_shader_file)
+        shader = _shader_cache.get(key)
+        if shader is not None:
+            return shader
+
         shader = Shader.make(Shader.SL_GLSL, 
             vertex=self.vertex_shader_file,
             fragment=self.fragment_shader_file
         )
         if not shader:
             raise RuntimeError(f"Failed to load shaders: {self.vertex_shader_file}, {self.fragment_shader_file}")
+        _shader_cache[key] = shader
         return shader
 
     def get_shader(self) -> Shader:
@@ -0,0 +1,64 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.backend.data_logging import DataLogger
+from src.backend.data_playback import DataPlayback
+from src.utils.telemetry_data import TelemetryData, status_flags_from_bits
+
+# Samples at exactly representable times, 0.25 s apart
+SAMPLES = [
+    TelemetryData(
+        position=(float(i), 2.0 * i, -0.5 * i),
+        orientation=(0.25 * i, 0.0, -1.0),
+        velocity=(1.5, -2.5, 3.5 * i),
+        acceleration=(0.0, 9.75, 0.125 * i),
+        voltage=3300 + i,
+        status_flags=status_flags_from_bits(i),
+        timestamp=1700000000.0 + 0.25 * i,
+    )
+    for i in range(16)
+]
+
+
+class LogPlaybackRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.log_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.log_dir)
+
+    def round_trip(self, binary: bool) -> DataPlayback:
+        data_logger = DataLogger(binary=binary)
+        data_logger.log_file_path = self.log_dir / data_logger.log_file_path.name
+        data_logger.start_logging()
+        for telemetry in SAMPLES:
+            data_logger.log_data(telemetry)
+        data_logger.stop_logging()
+
+        playback = DataPlayback(binary=binary)
+        playback.log_file_path = data_logger.log_file_path
+        self.assertTrue(playback.load_log())
+        return playback
+
+    def assertPlaysBackSamples(self, playback: DataPlayback):
+        self.assertEqual(len(playback._values), len(SAMPLES))
+        for index, expected in enumerate(SAMPLES):
+            telemetry = playback._telemetry_at(index)
+            self.assertEqual(telemetry.position, expected.position)
+            self.assertEqual(telemetry.orientation, expected.orientation)
+            self.assertEqual(telemetry.velocity, expected.velocity)
+            self.assertEqual(telemetry.acceleration, expected.acceleration)
+            self.assertEqual(telemetry.voltage, expected.voltage)
+            self.assertEqual(telemetry.status_flags, expected.status_flags)
+        # Playback is paced by nanoseconds since the first record
+        self.assertEqual(playback._times.tolist(), [250_000_000 * i for i in range(len(SAMPLES))])
+
+    def test_binary_round_trip(self):
+        self.assertPlaysBackSamples(self.round_trip(binary=True))
+
+    def test_csv_round_trip(self):
+        self.assertPlaysBackSamples(self.round_trip(binary=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import json
+import pickle
+import random
+import unittest
+
+from src.utils.constants import START_BYTE
+from src.utils.data_parser import SCALPEL_PACKET, TelemetryDataParser, parse_telemetry_data
+
+
+def cobs_encode(data: bytes) -> bytes:
+    """
+    Reference COBS encoder, the inverse of TelemetryDataParser.cobs_decode.
+    """
+    encoded = bytearray()
+    block = bytearray()
+    for byte in data:
+        if byte == 0:
+            encoded.append(len(block) + 1)
+            encoded += block
+            block.clear()
+            continue
+        block.append(byte)
+        if len(block) == 254:
+            encoded.append(255)
+            encoded += block
+            block.clear()
+    encoded.append(len(block) + 1)
+    encoded += block
+    return bytes(encoded)
+
+
+# Fixture sample: motor-safe flags (system_health | sensor_status), voltage within limits
+FIXTURE_VALUES = (
+    1.0, 2.0, 3.0,      # position
+    0.5, -0.25, 0.0,    # orientation
+    10.0, 0.0, -2.0,    # velocity
+    0.0, 9.75, 0.0,     # acceleration
+    3300,               # voltage
+    0x3,                # status_flags
+    1700000000.5,       # timestamp
+)
+
+
+def fixture_packet(values=FIXTURE_VALUES) -> bytes:
+    """
+    Builds a framed, COBS-encoded SCALPEL packet as the backend sends it.
+    """
+    return bytes([START_BYTE]) + cobs_encode(SCALPEL_PACKET.pack(*values))
+
+
+class CobsDecodeTest(unittest.TestCase):
+    def setUp(self):
+        self.parser = TelemetryDataParser()
+
+    def assertRoundTrips(self, data: bytes):
+        self.assertEqual(self.parser.cobs_decode(cobs_encode(data)), data)
+
+    def test_empty_and_single_bytes(self):
+        self.assertEqual(self.parser.cobs_decode(b''), b'')
+        self.assertRoundTrips(b'')
+        self.assertRoundTrips(b'\x00')
+        self.assertRoundTrips(b'\x01')
+
+    def test_zero_runs(self):
+        self.assertEqual(self.parser.cobs_decode(b'\x01\x01\x01\x01'), b'\x00\x00\x00')
+        self.assertRoundTrips(b'\x00' * 10)
+        self.assertRoundTrips(b'\x11\x00\x00\x22\x00')
+
+    def test_no_trailing_zero_is_added(self):
+        self.assertEqual(self.parser.cobs_decode(b'\x03\x11\x22'), b'\x11\x22')
+
+    def test_254_byte_blocks(self):
+        block = bytes(range(1, 255))
+        self.assertEqual(len(block), 254)
+        self.assertRoundTrips(block)
+        self.assertRoundTrips(block + b'\x00')
+        self.assertRoundTrips(block + b'\x01')
+        self.assertRoundTrips(block * 3)
+        self.assertRoundTrips(b'\x00' + block + b'\x00' + block)
+
+    def test_random_round_trip(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            data = bytes(rng.choice((0, 0, rng.randrange(256))) for _ in range(rng.randrange(600)))
+            self.assertRoundTrips(data)
+
+    def test_zero_code_byte_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.parser.cobs_decode(b'\x02\x11\x00\x22')
+
+
+class ParseTelemetryDataTest(unittest.TestCase):
+    def test_fixture_packet(self):
+        parsed = parse_telemetry_data(fixture_packet())
+        self.assertEqual(parsed, {
+            'position': (1.0, 2.0, 3.0),
+            'orientation': (0.5, -0.25, 0.0),
+            'velocity': (10.0, 0.0, -2.0),
+            'acceleration': (0.0, 9.75, 0.0),
+            'voltage': 3300,
+            'status_flags': {'system_health': True, 'sensor_status': True,
+                             'motor_failure': False, 'sensor_error': False},
+            'timestamp': '2023-11-14T22:13:20.500000+00:00',
+        })
+
+    def test_fixture_packet_matches_to_dict(self):
+        telemetry = TelemetryDataParser().parse_raw_data(fixture_packet())
+        self.assertEqual(parse_telemetry_data(fixture_packet()), telemetry.to_dict())
+
+    def test_parses_into_given_dict(self):
+        telemetry_data = {}
+        self.assertIs(parse_telemetry_data(fixture_packet(), telemetry_data), telemetry_data)
+        self.assertEqual(telemetry_data['voltage'], 3300)
+
+    def test_invalid_packets_are_rejected(self):
+        over_voltage = FIXTURE_VALUES[:12] + (6000,) + FIXTURE_VALUES[13:]
+        motor_failure = FIXTURE_VALUES[:13] + (0x4,) + FIXTURE_VALUES[14:]
+        for packet in (b'', b'\x00' + fixture_packet()[1:], fixture_packet()[:-1],
+                       fixture_packet(over_voltage), fixture_packet(motor_failure)):
+            telemetry_data = {}
+            with self.assertLogs('event', 'ERROR'), self.assertRaises(ValueError):
+                parse_telemetry_data(packet, telemetry_data)
+            self.assertEqual(telemetry_data, {})
+
+    def test_parsed_output_round_trips_through_json(self):
+        parsed = parse_telemetry_data(fixture_packet())
+        decoded = json.loads(json.dumps(parsed))
+        # json has no tuples, so the vector fields come back as lists
+        self.assertEqual(decoded, {key: list(value) if isinstance(value, tuple) else value
+                                   for key, value in parsed.items()})
+
+    def test_parsed_output_round_trips_through_pickle(self):
+        parsed = parse_telemetry_data(fixture_packet())
+        self.assertEqual(pickle.loads(pickle.dumps(parsed)), parsed)
+
+        telemetry = TelemetryDataParser().parse_raw_data(fixture_packet())
+        self.assertEqual(pickle.loads(pickle.dumps(telemetry)), telemetry)
+
+    def test_status_flags_are_not_shared(self):
+        first = parse_telemetry_data(fixture_packet())
+        second = parse_telemetry_data(fixture_packet())
+        first['status_flags']['system_health'] = False
+        self.assertTrue(second['status_flags']['system_health'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import time
+import unittest
+from datetime import datetime, timezone
+
+from src.utils.telemetry_data import TelemetryData
+
+
+def make_telemetry(**fields) -> TelemetryData:
+    values = dict(position=(0.0, 0.0, 0.0), orientation=(0.0, 0.0, 0.0), velocity=(0.0, 0.0, 0.0),
+                  acceleration=(0.0, 0.0, 0.0), voltage=3300, status_flags={})
+    values.update(fields)
+    return TelemetryData(**values)
+
+
+class TimestampTest(unittest.TestCase):
+    def test_default_timestamp_is_current_posix_time(self):
+        self.assertAlmostEqual(make_telemetry().timestamp_seconds, time.time(), delta=1.0)
+
+    def test_float_and_datetime_timestamps_format_alike(self):
+        seconds = 1700000000.25
+        from_float = make_telemetry(timestamp=seconds)
+        from_datetime = make_telemetry(timestamp=datetime.fromtimestamp(seconds, timezone.utc))
+        self.assertEqual(from_float.timestamp_iso, '2023-11-14T22:13:20.250000+00:00')
+        self.assertEqual(from_datetime.timestamp_iso, from_float.timestamp_iso)
+        self.assertEqual(from_datetime.timestamp_seconds, seconds)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,53 @@
+from src.utils.telemetry_data import status_flags_from_bits
 from src.utils.data_parser import parse_telemetry_data
 from src.utils.constants import ROCKETLINK_LIB_PATH
 from src.utils.logger import logger
+from datetime import datetime, timezone
 from typing import Dict, Any
-from enum import Enum
+from pathlib import Path
+from enum import IntEnum
+import asyncio
 import ctypes
 
 
-
-
-class Command(Enum):
+# Resolved once so every connection loads the same absolute library path
+_ROCKETLINK_LIB_PATH = Path(ROCKETLINK_LIB_PATH).resolve()
+_rocketlink_lib = None
+
+
+def _load_rocketlink_lib() -> ctypes.CDLL:
+    """
+    Loads the RocketLink shared library, reusing the handle across connections
+    so the dynamic linker only runs once per process.
+    """
+    global _rocketlink_lib
+    if _rocketlink_lib is None:
+        _rocketlink_lib = ctypes.CDLL(str(_ROCKETLINK_LIB_PATH), mode=ctypes.RTLD_LOCAL)
+    return _rocketlink_lib
+
+
+class TelemetryFrame(ctypes.Structure):
+    """
+    Binary telemetry frame as laid out by the RocketLink backend's
+    receive_telemetry_frame export. Reading it is a single memcpy with no
+    text decoding or parsing.
+    """
+    _pack_ = 1
+    _fields_ = [
+        ('timestamp', ctypes.c_double),
+        ('position', ctypes.c_double * 3),
+        ('orientation', ctypes.c_double * 3),
+        ('velocity', ctypes.c_double * 3),
+        ('acceleration', ctypes.c_double * 3),
+        ('voltage', ctypes.c_uint32),
+        ('status_flags', ctypes.c_uint8),
+    ]
+
+
+class Command(IntEnum):
+    """
+    Commands understood by the RocketLink backend. Members are ints, so they are passed to the C library as is.
+    """
     START_MISSION = 1
     ABORT_MISSION = 2
     REQUEST_TELEMETRY = 3
@@ -21,19 +60,34 @@ class RocketLinkInterface:
     def __init__(self):
         self.rocketlink_lib = None
         self.connection_established = False
+        self.frame_telemetry = False
+        # Bound foreign functions, cached to skip CDLL attribute lookup per call
+        self._c_send_command = None
+        self._c_receive_telemetry = None
+        self._c_close_connection = None
 
     def initialize_connection(self) -> None:
         """
         Establishes and configures the connection with the RocketLink backend.
         """
         try:
-            self.rocketlink_lib = ctypes.CDLL(ROCKETLINK_LIB_PATH)
+            self.rocketlink_lib = _load_rocketlink_lib()
             self.rocketlink_lib.initialize.restype = ctypes.c_int
             self.rocketlink_lib.send_command.argtypes = [ctypes.c_int]
             self.rocketlink_lib.send_command.restype = ctypes.c_int
             self.rocketlink_lib.receive_telemetry.restype = ctypes.c_char_p
             self.rocketlink_lib.close_connection.restype = ctypes.c_int
 
+            # Prefer the binary frame export when the backend provides it
+            self.frame_telemetry = hasattr(self.rocketlink_lib, 'receive_telemetry_frame')
+            if self.frame_telemetry:
+                self.rocketlink_lib.receive_telemetry_frame.restype = ctypes.POINTER(TelemetryFrame)
+                self._c_receive_telemetry = self.rocketlink_lib.receive_telemetry_frame
+            else:
+                self._c_receive_telemetry = self.rocketlink_lib.receive_telemetry
+            self._c_send_command = self.rocketlink_lib.send_command
+            self._c_close_connection = self.rocketlink_lib.close_connection
+
             result = self.rocketlink_lib.initialize()
             if result != 0:
                 raise CommunicationError("Failed to initialize RocketLink connection")
@@ -41,7 +95,7 @@ class RocketLinkInterface:
             self.connection_established = True
             logger.log_event("RocketLink connection established", "INFO")
         except Exception as e:
-            logger.log_event(f"Error initializing RocketLink connection: {str(e)}", "ERROR")
+            logger.log_event("Error initializing RocketLink connection: %s", "ERROR", e)
             raise CommunicationError(f"Failed to initialize RocketLink connection: {str(e)}")
 
     def send_command(self, command: Command) -> None:
@@ -54,12 +108,12 @@ class RocketLinkInterface:
             raise CommunicationError("Connection not established. Call initialize_connection() first.")
 
         try:
-            result = self.rocketlink_lib.send_command(command.value)
+            result = self._c_send_command(command)
             if result != 0:
                 raise CommunicationError(f"Failed to send command: {command.name}")
-            logger.log_event(f"Command sent: {command.name}", "INFO")
+            logger.log_event("Command sent: %s", "INFO", command.name)
         except Exception as e:
-            logger.log_event(f"Error sending command: {str(e)}", "ERROR")
+            logger.log_event("Error sending command: %s", "ERROR", e)
             raise CommunicationError(f"Failed to send command: {str(e)}")
 
     def receive_telemetry(self) -> Dict[str, Any]:
@@ -68,21 +122,63 @@ class RocketLinkInterface:
 
         :return: Dictionary containing parsed telemetry data
         """
+        return self.receive_telemetry_into({})
+
+    def receive_telemetry_into(self, telemetry_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Receives telemetry data from the RocketLink backend into an existing dictionary,
+        so a caller polling in a loop can reuse one dictionary for every sample.
+
+        :param telemetry_data: Dictionary to fill; its telemetry keys are overwritten
+        :return: telemetry_data
+        """
         if not self.connection_established:
             raise CommunicationError("Connection not established. Call initialize_connection() first.")
 
         try:
-            raw_data = self.rocketlink_lib.receive_telemetry()
-            if raw_data is None:
-                raise CommunicationError("Failed to receive telemetry data")
-            
-            telemetry_data = parse_telemetry_data(raw_data.decode('utf-8'))
+            if self.frame_telemetry:
+                frame_ptr = self._c_receive_telemetry()
+                if not frame_ptr:
+                    raise CommunicationError("Failed to receive telemetry data")
+                self._frame_into(frame_ptr.contents, telemetry_data)
+            else:
+                raw_data = self._c_receive_telemetry()
+                if raw_data is None:
+                    raise CommunicationError("Failed to receive telemetry data")
+
+                parse_telemetry_data(raw_data, telemetry_data)
             logger.log_telemetry(telemetry_data)
             return telemetry_data
         except Exception as e:
-            logger.log_event(f"Error receiving telemetry: {str(e)}", "ERROR")
+            logger.log_event("Error receiving telemetry: %s", "ERROR", e)
             raise CommunicationError(f"Failed to receive telemetry: {str(e)}")
 
+    async def receive_telemetry_async(self) -> Dict[str, Any]:
+        """
+        Receives telemetry without blocking the event loop; the blocking C call runs in a worker thread.
+
+        :return: Dictionary containing parsed telemetry data
+        """
+        # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+        return await asyncio.get_running_loop().run_in_executor(None, self.receive_telemetry)
+
+    @staticmethod
+    def _frame_into(frame: TelemetryFrame, telemetry_data: Dict[str, Any]) -> None:
+        """
+        Copies a binary telemetry frame into a telemetry dictionary.
+
+        :param frame: TelemetryFrame returned by the backend
+        :param telemetry_data: Dictionary to fill
+        """
+        telemetry_data['position'] = tuple(frame.position)
+        telemetry_data['orientation'] = tuple(frame.orientation)
+        telemetry_data['velocity'] = tuple(frame.velocity)
+        telemetry_data['acceleration'] = tuple(frame.acceleration)
+        telemetry_data['voltage'] = frame.voltage
+        telemetry_data['status_flags'] = status_flags_from_bits(frame.status_flags)
+        # ISO string, matching the timestamp parse_telemetry_data produces for SCALPEL packets
+        telemetry_data['timestamp'] = datetime.fromtimestamp(frame.timestamp, timezone.utc).isoformat()
+
     def close_connection(self) -> None:
         """
         Gracefully terminates the connection with the backend.
@@ -91,15 +187,25 @@ class RocketLinkInterface:
             return
 
         try:
-            result = self.rocketlink_lib.close_connection()
+            result = self._c_close_connection()
             if result != 0:
                 raise CommunicationError("Failed to close RocketLink connection")
             
             self.connection_established = False
             logger.log_event("RocketLink connection closed", "INFO")
         except Exception as e:
-            logger.log_event(f"Error closing RocketLink connection: {str(e)}", "ERROR")
+            logger.log_event("Error closing RocketLink connection: %s", "ERROR", e)
             raise CommunicationError(f"Failed to close RocketLink connection: {str(e)}")
 
-# Global RocketLinkInterface instance
-rocket_link = RocketLinkInterface()
\ No newline at end of file
+# Shared RocketLinkInterface instance, created on first use
+_rocket_link = None
+
+
+def get_rocket_link() -> RocketLinkInterface:
+    """
+    Returns the shared RocketLinkInterface, creating it on first call.
+    """
+    global _rocket_link
+    if _rocket_link is None:
+        _rocket_link = RocketLinkInterface()
+    return _rocket_link
\ No newline at end of file
@@ -1,32 +1,39 @@
 from pathlib import Path
+from typing import Final
 
 # Telemetry Configuration
-UPDATE_INTERVAL_MS = 100
-DATA_FORMAT = 'AVC_SCALPEL'
+UPDATE_INTERVAL_MS: Final[int] = 100
+DATA_FORMAT: Final[str] = 'AVC_SCALPEL'
 
 # File Paths
-LOG_DIR = Path('/var/log/novoground')
-TELEMETRY_LOG_FILE = 'telemetry.log'
-EVENT_LOG_FILE = 'events.log'
-CONFIG_FILE_PATH = Path('/etc/novoground/config.yaml')
+LOG_DIR: Final[Path] = Path('/var/log/novoground')
+TELEMETRY_LOG_FILE: Final[str] = 'telemetry.log'
+EVENT_LOG_FILE: Final[str] = 'events.log'
+LOG_FILE_BUFFER_SIZE: Final[int] = 64 * 1024  # bytes
+TELEMETRY_BINARY_LOG_FILE: Final[str] = 'telemetry.bin'
+TELEMETRY_LOG_BUFFER_SIZE: Final[int] = 1 << 20  # bytes
+TELEMETRY_LOG_FLUSH_ROWS: Final[int] = 256
+TELEMETRY_LOG_FLUSH_INTERVAL: Final[float] = 1.0  # seconds
+TELEMETRY_BINARY_CHUNK_SIZE: Final[int] = 64 * 1024  # bytes
+CONFIG_FILE_PATH: Final[Path] = Path('/etc/novoground/config.yaml')
 
 # Communication Parameters
-RADIO_MODULE = 'XBeePro900HP'
-PACKET_TIMEOUT = 5  # seconds
+RADIO_MODULE: Final[str] = 'XBeePro900HP'
+PACKET_TIMEOUT: Final[int] = 5  # seconds
 
 # Thresholds and Flags
-MAX_VOLTAGE = 5000  # millivolts
-CRITICAL_STATUS_FLAGS = ['motor_failure', 'sensor_error']
+MAX_VOLTAGE: Final[int] = 5000  # millivolts
+CRITICAL_STATUS_FLAGS: Final[tuple] = ('motor_failure', 'sensor_error')
 
 # Protocol-Specific Constants
-START_BYTE = 170
-COBS_BYTE = 0x00
+START_BYTE: Final[int] = 170
+COBS_BYTE: Final[int] = 0x00
 
 # Logging Configuration
-LOG_LEVEL = 'INFO'
+LOG_LEVEL: Final[str] = 'INFO'
 
 # RocketLink Library Path
-ROCKETLINK_LIB_PATH = '/usr/local/lib/librocketlink.so'
+ROCKETLINK_LIB_PATH: Final[str] = '/usr/local/lib/librocketlink.so'
 
 # 3D Model Configuration
-ROCKET_MODEL_PATH = Path('/usr/share/novoground/models/rocket.obj')
+ROCKET_MODEL_PATH: Final[Path] = Path('/usr/share/novoground/models/rocket.obj')
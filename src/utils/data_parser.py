@@ -1,10 +1,18 @@
-from src.utils.constants import START_BYTE, COBS_BYTE
-from src.utils.telemetry_data import TelemetryData
+from src.utils.constants import START_BYTE, COBS_BYTE, MAX_VOLTAGE, CRITICAL_STATUS_FLAGS
+from src.utils.telemetry_data import TelemetryData, SCALPEL_DTYPE, STATUS_FLAG_MASKS, STATUS_FLAG_TABLE, ALL_STATUS_FLAGS_MASK, status_flags_from_bits
 from src.utils.logger import logger
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import numpy as np
 import struct
 
+# SCALPEL packet: position, orientation, velocity and acceleration (3 floats each),
+# voltage (uint32), status flags (uint32) and timestamp (double), little-endian
+SCALPEL_PACKET = struct.Struct('<' + 'f' * 12 + 'II' + 'd')
+
+# Status flag bits that make a packet invalid
+CRITICAL_STATUS_MASK = sum(mask for name, mask in STATUS_FLAG_MASKS if name in CRITICAL_STATUS_FLAGS)
+
 
 class TelemetryDataParser:
     def parse_raw_data(self, raw_bytes: bytes) -> TelemetryData:
@@ -15,26 +23,40 @@ class TelemetryDataParser:
         :return: Parsed TelemetryData object.
         :raises CommunicationError: If parsing fails due to invalid data.
         """
+        return TelemetryData(**self._parse_into(raw_bytes, {}))
+
+    def _parse_into(self, raw_bytes: bytes, out: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parses and validates a raw packet, writing its fields into out.
+        out is left untouched if the packet is rejected.
+
+        :param raw_bytes: Raw byte data from the backend.
+        :param out: Dictionary the parsed telemetry fields are written into.
+        :return: out, holding the parsed telemetry data.
+        """
         try:
             if not raw_bytes:
                 raise ValueError("Received empty telemetry data.")
 
+            # Slices of a memoryview share the packet buffer instead of copying it
+            packet = memoryview(raw_bytes)
+
             # Check for START_BYTE
-            if raw_bytes[0] != START_BYTE:
-                raise ValueError(f"Invalid start byte: {raw_bytes[0]}")
+            if packet[0] != START_BYTE:
+                raise ValueError(f"Invalid start byte: {packet[0]}")
 
             # Remove START_BYTE and perform COBS decoding
-            encoded_data = raw_bytes[1:]
-            decoded_data = self.cobs_decode(encoded_data)
+            decoded_data = self.cobs_decode(packet[1:])
 
             # Parse the decoded data according to the SCALPEL protocol
-            parsed_dict = self.parse_scalpel_packet(decoded_data)
+            unpacked = self._unpack_scalpel_packet(decoded_data)
 
-            # Validate the parsed data
-            self.validate_data(parsed_dict)
+            # Validate voltage and critical flags from the raw values in one branch;
+            # validate_data only runs to report which check failed
+            if unpacked[12] > MAX_VOLTAGE or unpacked[13] & CRITICAL_STATUS_MASK:
+                self.validate_data(self._scalpel_fields(unpacked, {}))
 
-            telemetry = TelemetryData(**parsed_dict)
-            return telemetry
+            return self._scalpel_fields(unpacked, out)
 
         except Exception as e:
             self.handle_parsing_errors(e)
@@ -48,35 +70,55 @@ class TelemetryDataParser:
         :return: Dictionary of parsed telemetry data.
         :raises ValueError: If packet structure is invalid.
         """
-        try:
-            # Example SCALPEL packet structure:
-            # [Position (3 floats), Orientation (3 floats), Velocity (3 floats),
-            #  Acceleration (3 floats), Voltage (1 int), Status Flags (1 int),
-            #  Timestamp (double)]
+        return self._scalpel_fields(self._unpack_scalpel_packet(data), {})
 
-            format_str = 'fff' * 4 + 'I' + 'I' + 'd'
-            expected_size = struct.calcsize(format_str)
+    def _unpack_scalpel_packet(self, data: bytes) -> tuple:
+        """
+        Unpacks a SCALPEL protocol packet into its flat tuple of values.
 
-            if len(data) != expected_size:
+        :param data: Decoded byte data.
+        :return: Tuple of unpacked values in SCALPEL_PACKET order.
+        :raises ValueError: If packet structure is invalid.
+        """
+        try:
+            if len(data) != SCALPEL_PACKET.size:
                 raise ValueError(f"Unexpected packet size: {len(data)} bytes.")
 
-            unpacked = struct.unpack(format_str, data)
-
-            parsed_data = {
-                'position': unpacked[0:3],
-                'orientation': unpacked[3:6],
-                'velocity': unpacked[6:9],
-                'acceleration': unpacked[9:12],
-                'voltage': unpacked[12],
-                'status_flags': self.decode_status_flags(unpacked[13]),
-                'timestamp': datetime.fromtimestamp(unpacked[14]),
-            }
-
-            return parsed_data
+            return SCALPEL_PACKET.unpack_from(data)
 
         except struct.error as e:
             raise ValueError(f"Struct unpacking failed: {str(e)}")
 
+    @staticmethod
+    def _scalpel_fields(unpacked: tuple, out: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Writes unpacked SCALPEL values into a telemetry field dictionary.
+
+        :param unpacked: Tuple of values in SCALPEL_PACKET order.
+        :param out: Dictionary the telemetry fields are written into.
+        :return: out, holding the parsed telemetry data.
+        """
+        out['position'] = unpacked[0:3]
+        out['orientation'] = unpacked[3:6]
+        out['velocity'] = unpacked[6:9]
+        out['acceleration'] = unpacked[9:12]
+        out['voltage'] = unpacked[12]
+        out['status_flags'] = dict(STATUS_FLAG_TABLE[unpacked[13] & ALL_STATUS_FLAGS_MASK])
+        out['timestamp'] = unpacked[14]
+        return out
+
+    def parse_many(self, data: bytes) -> np.ndarray:
+        """
+        Parses back-to-back decoded SCALPEL packets in a single call.
+
+        :param data: Decoded packets concatenated without framing.
+        :return: Structured array with one SCALPEL_DTYPE record per packet, viewing data without a copy.
+        :raises ValueError: If data is not a whole number of packets.
+        """
+        if len(data) % SCALPEL_DTYPE.itemsize:
+            raise ValueError(f"Unexpected batch size: {len(data)} bytes.")
+        return np.frombuffer(data, dtype=SCALPEL_DTYPE)
+
     def validate_data(self, parsed_data: Dict[str, Any]) -> None:
         """
         Ensures the integrity and validity of the parsed telemetry data.
@@ -85,24 +127,40 @@ class TelemetryDataParser:
         :raises ValueError: If validation fails.
         """
         # Validate voltage
-        if parsed_data['voltage'] > 5000:
+        if parsed_data['voltage'] > MAX_VOLTAGE:
             raise ValueError(f"Voltage {parsed_data['voltage']} exceeds maximum allowed value.")
 
         # Validate critical status flags
-        critical_flags = ['motor_failure', 'sensor_error']
-        for flag in critical_flags:
+        for flag in CRITICAL_STATUS_FLAGS:
             if parsed_data['status_flags'].get(flag, False):
                 raise ValueError(f"Critical status flag '{flag}' is set.")
 
         # Additional validations can be added here as per SCALPEL protocol
 
+    def validate_batch(self, packets: np.ndarray) -> None:
+        """
+        Validates a batch from parse_many with one vectorized pass per check.
+
+        :param packets: Structured array of SCALPEL_DTYPE records.
+        :raises ValueError: If any packet fails validation, naming the first offending index.
+        """
+        over_voltage = packets['voltage'] > MAX_VOLTAGE
+        if over_voltage.any():
+            index = int(np.argmax(over_voltage))
+            raise ValueError(f"Packet {index}: voltage {packets['voltage'][index]} exceeds maximum allowed value.")
+
+        critical = (packets['status_flags'] & CRITICAL_STATUS_MASK) != 0
+        if critical.any():
+            index = int(np.argmax(critical))
+            raise ValueError(f"Packet {index}: critical status flag is set.")
+
     def handle_parsing_errors(self, error: Exception) -> None:
         """
         Manages exceptions and errors encountered during the parsing process.
 
         :param error: The exception that was raised.
         """
-        logger.log_event(f"Telemetry data parsing error: {str(error)}", "ERROR")
+        logger.log_event("Telemetry data parsing error: %s", "ERROR", error)
 
     def decode_status_flags(self, bitmask: int) -> Dict[str, bool]:
         """
@@ -111,40 +169,62 @@ class TelemetryDataParser:
         :param bitmask: Integer representing the status flags.
         :return: Dictionary with status flag names as keys and their boolean states.
         """
-        flag_mapping = {
-            0: 'system_health',
-            1: 'sensor_status',
-            2: 'motor_failure',
-            3: 'sensor_error',
-            # Add more flags as defined by the SCALPEL protocol
-        }
-        status_flags = {}
-        for bit, name in flag_mapping.items():
-            status_flags[name] = bool(bitmask & (1 << bit))
-        return status_flags
+        return status_flags_from_bits(bitmask)
 
     def cobs_decode(self, data: bytes) -> bytes:
         """
         Decodes data using Consistent Overhead Byte Stuffing (COBS).
 
-        :param data: COBS-encoded byte data.
+        :param data: COBS-encoded byte data, as bytes or a memoryview.
         :return: Decoded byte data.
         :raises ValueError: If COBS decoding fails.
         """
         if not data:
             return b''
 
-        decoded = bytearray()
+        # Decoding never grows the data, so one buffer of the input size holds the result
+        length = len(data)
+        decoded = bytearray(length)
         index = 0
+        out = 0
 
-        while index < len(data):
+        # Each iteration copies a whole block, so the Python loop runs once per block, not per byte
+        while index < length:
             code = data[index]
             if code == 0:
                 raise ValueError("COBS decoding error: Zero byte encountered.")
             index += 1
-            decoded += data[index:index + code - 1]
-            if code < 0xFF and index < len(data):
-                decoded.append(COBS_BYTE)
-            index += code - 1
-
-        return bytes(decoded)
\ No newline at end of file
+            end = index + code - 1
+            block = data[index:end]
+            size = len(block)
+            decoded[out:out + size] = block
+            out += size
+            # The last block's implicit zero is the frame delimiter, not data
+            if code < 0xFF and end < length:
+                decoded[out] = COBS_BYTE
+                out += 1
+            index = end
+
+        del decoded[out:]
+        return bytes(decoded)
+
+
+# Shared parser for callers that only need the telemetry dictionary
+_parser = TelemetryDataParser()
+
+
+def parse_telemetry_data(raw: bytes, telemetry_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Parses a raw telemetry packet straight from the backend's bytes, without decoding it to text first.
+
+    :param raw: Raw packet bytes (or a memoryview over them) as returned by the RocketLink backend.
+    :param telemetry_data: Dictionary to write the parsed fields into; a new one is created if omitted.
+    :return: Dictionary containing parsed telemetry data.
+    :raises ValueError: If the packet is invalid.
+    """
+    # Skips building a TelemetryData only to convert it back with to_dict
+    if telemetry_data is None:
+        telemetry_data = {}
+    _parser._parse_into(raw, telemetry_data)
+    telemetry_data['timestamp'] = datetime.fromtimestamp(telemetry_data['timestamp'], timezone.utc).isoformat()
+    return telemetry_data
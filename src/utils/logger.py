@@ -1,10 +1,127 @@
-from src.utils.constants import LOG_DIR, TELEMETRY_LOG_FILE, EVENT_LOG_FILE, LOG_LEVEL
-from datetime import datetime
+from src.utils.constants import LOG_DIR, TELEMETRY_LOG_FILE, EVENT_LOG_FILE, LOG_LEVEL, LOG_FILE_BUFFER_SIZE
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any
 import logging
+import atexit
+import queue
+import os
+import sys
+import traceback
+
+# Level names accepted by log_event, in both cases so lookups need no case conversion
+LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+LOG_LEVELS.update({name.lower(): level for name, level in list(LOG_LEVELS.items())})
+
+# File descriptor records fall back to when the log file cannot be opened
+STDERR_FILENO = 2
+
+class AppendFileHandler(logging.Handler):
+    """
+    Writes records to a file descriptor opened for appending. Encoded records are
+    collected in memory and written with a single os.write when the handler is flushed
+    or the pending data exceeds buffer_size, bypassing Python's file object layers.
+    The file is opened on the first write, so creating the handler never touches the disk.
+    If it cannot be opened, the failure is reported once and records go to stderr instead.
+    """
+    terminator = '\n'
+
+    def __init__(self, filename, buffer_size: int = LOG_FILE_BUFFER_SIZE):
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.fd = None
+        self.owns_fd = False  # False while falling back to stderr
+        self.write_failed = False  # Set once a write error has been reported
+        self.buffer_size = buffer_size
+        self.pending = []
+        self.pending_size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + self.terminator).encode('utf-8')
+            self.pending.append(data)
+            self.pending_size += len(data)
+            if self.pending_size >= self.buffer_size:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        view = memoryview(b''.join(self.pending))
+        self.pending.clear()
+        self.pending_size = 0
+        if self.fd is None:
+            self._open()
+        try:
+            while view:
+                view = view[os.write(self.fd, view):]
+        except OSError:
+            # flush also runs on the listener thread, which must survive an unwritable log file.
+            # The batch is dropped, and only the first failure is reported.
+            if not self.write_failed:
+                self.write_failed = True
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+
+    def _open(self) -> None:
+        try:
+            self.fd = os.open(self.filename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self.owns_fd = True
+        except OSError as e:
+            # Reported here once; from now on records go to stderr
+            sys.stderr.write(f"Cannot open log file {self.filename} ({e}); logging to stderr instead.\n")
+            self.fd = STDERR_FILENO
+            self.owns_fd = False
+
+    def close(self) -> None:
+        try:
+            self.flush()
+            if self.owns_fd:
+                os.close(self.fd)
+            self.fd = None
+            self.owns_fd = False
+        finally:
+            super().close()
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that enqueues records unformatted, so %-style arguments are merged
+    on the listener thread rather than by the caller. The queue stays in-process,
+    so records need no pickling, but arguments must not be mutated after logging.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Flushes its handlers only once the queue is drained, so a burst of records is written out together.
+    """
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
 
 class Logger:
+    """
+    Telemetry and event loggers. Records are handed to a queue on the calling thread,
+    and formatting and file I/O happen on a background QueueListener per logger.
+    """
     def __init__(self):
+        self.listeners = {}
+        self.configured = False  # Set once configure_logging has run
         self.telemetry_logger = self._setup_logger('telemetry', TELEMETRY_LOG_FILE)
         self.event_logger = self._setup_logger('event', EVENT_LOG_FILE)
 
@@ -12,37 +129,71 @@ class Logger:
         logger = logging.getLogger(name)
         logger.setLevel(LOG_LEVEL)
 
-        file_handler = logging.FileHandler(LOG_DIR / log_file)
+        file_handler = AppendFileHandler(LOG_DIR / log_file)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
 
-        logger.addHandler(file_handler)
+        # The caller only enqueues the record; the listener thread writes it out
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        listener = BatchingQueueListener(log_queue, file_handler)
+        listener.start()
+        self.listeners[name] = listener
         return logger
 
+    def _add_handler(self, name: str, handler: logging.Handler) -> None:
+        """
+        Adds a handler to the background listener of the named logger,
+        unless it already has a handler of the same type.
+        """
+        listener = self.listeners[name]
+        if any(type(existing) is type(handler) for existing in listener.handlers):
+            return
+        listener.handlers = listener.handlers + (handler,)
+
+    def shutdown(self) -> None:
+        """
+        Writes out queued records, stops the listener threads and closes their files.
+        """
+        for listener in self.listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+                if isinstance(handler, AppendFileHandler):
+                    handler.close()
+        self.listeners.clear()
+
     def log_telemetry(self, data: Dict[str, Any]) -> None:
         """
         Logs incoming telemetry data.
         
         :param data: Dictionary containing telemetry data
         """
-        timestamp = datetime.now().isoformat()
-        telemetry_str = f"{timestamp} - {data}"
-        self.telemetry_logger.info(telemetry_str)
+        # The formatter already stamps asctime, and the dict repr is built on the listener thread.
+        # Callers may reuse their dict for the next sample, so a shallow copy is queued.
+        if self.telemetry_logger.isEnabledFor(logging.INFO):
+            self.telemetry_logger.info("%s", dict(data))
 
-    def log_event(self, event: str, level: str = 'INFO') -> None:
+    def log_event(self, event: str, level: str = 'INFO', *args: Any) -> None:
         """
         Logs significant system events or errors.
         
-        :param event: Description of the event
+        :param event: Description of the event, optionally a %-style format string
         :param level: Log level (INFO, WARNING, ERROR, CRITICAL)
+        :param args: Arguments merged into event only if the record is emitted
         """
-        log_method = getattr(self.event_logger, level.lower())
-        log_method(event)
+        level_number = LOG_LEVELS[level]
+        if self.event_logger.isEnabledFor(level_number):
+            self.event_logger.log(level_number, event, *args)
 
     def configure_logging(self) -> None:
         """
         Sets up logging configurations such as log levels, formats, and destinations.
+        Later calls do nothing, so handlers are never registered twice.
         """
+        if self.configured:
+            return
+
         # Ensure log directory exists
         LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -54,10 +205,13 @@ class Logger:
         console_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         console_handler.setFormatter(console_formatter)
 
-        self.telemetry_logger.addHandler(console_handler)
-        self.event_logger.addHandler(console_handler)
+        self._add_handler('telemetry', console_handler)
+        self._add_handler('event', console_handler)
 
+        # Only set once setup has succeeded, so a failed call (e.g. mkdir) can be retried
+        self.configured = True
         self.log_event("Logging system initialized")
 
 # Global logger instance
 logger = Logger()
+atexit.register(logger.shutdown)
@@ -1,21 +1,89 @@
-from dataclasses import dataclass, field
-from typing import Tuple, Dict, Any
-from datetime import datetime
+from typing import Tuple, Dict, Any, Union
+from datetime import datetime, timezone
+from types import MappingProxyType
+import numpy as np
 
 
+# Status flag bit positions as defined by the SCALPEL protocol
+STATUS_FLAG_MASKS = (
+    ('system_health', 0x1),
+    ('sensor_status', 0x2),
+    ('motor_failure', 0x4),
+    ('sensor_error', 0x8),
+)
+
+
+# SCALPEL packet layout as a numpy record, matching data_parser.SCALPEL_PACKET
+SCALPEL_DTYPE = np.dtype([
+    ('position', '<f4', (3,)),
+    ('orientation', '<f4', (3,)),
+    ('velocity', '<f4', (3,)),
+    ('acceleration', '<f4', (3,)),
+    ('voltage', '<u4'),
+    ('status_flags', '<u4'),
+    ('timestamp', '<f8'),
+])
+
+
+# Every defined status flag bit
+ALL_STATUS_FLAGS_MASK = sum(mask for _, mask in STATUS_FLAG_MASKS)
+
+# Decoded status flags for every combination of defined bits, built once at import.
+# Entries are read-only templates; callers get their own copy, so samples never share a dict.
+STATUS_FLAG_TABLE = tuple(
+    MappingProxyType({name: bool(bits & mask) for name, mask in STATUS_FLAG_MASKS})
+    for bits in range(ALL_STATUS_FLAGS_MASK + 1)
+)
+
+
+def status_flags_from_bits(bits: int) -> Dict[str, bool]:
+    """
+    Expands a packed status flag bitfield into the status flag dictionary.
+
+    :param bits: Integer with one bit per status flag; undefined bits are ignored.
+    :return: Dictionary with status flag names as keys and their boolean states.
+    """
+    return dict(STATUS_FLAG_TABLE[bits & ALL_STATUS_FLAGS_MASK])
+
+
+# Default for TelemetryData's timestamp, so an explicit None is kept rather than replaced
+_NOW = object()
+
 
-@dataclass
 class TelemetryData:
     """
     Represents structured telemetry data received from the RocketLink C++ backend.
+    Written out with __slots__ rather than as a dataclass, since dataclass(slots=True) needs Python 3.10.
     """
-    position: Tuple[float, float, float]
-    orientation: Tuple[float, float, float]
-    velocity: Tuple[float, float, float]
-    acceleration: Tuple[float, float, float]
-    voltage: int
-    status_flags: Dict[str, bool]
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    __slots__ = ('position', 'orientation', 'velocity', 'acceleration', 'voltage', 'status_flags', 'timestamp')
+
+    def __init__(self,
+                 position: Tuple[float, float, float],
+                 orientation: Tuple[float, float, float],
+                 velocity: Tuple[float, float, float],
+                 acceleration: Tuple[float, float, float],
+                 voltage: int,
+                 status_flags: Dict[str, bool],
+                 timestamp: Union[float, datetime] = _NOW):
+        self.position = position
+        self.orientation = orientation
+        self.velocity = velocity
+        self.acceleration = acceleration
+        self.voltage = voltage
+        self.status_flags = status_flags
+        # Parsers store the packet's POSIX time as a float; it is only turned into a datetime when formatted
+        self.timestamp = datetime.now(timezone.utc) if timestamp is _NOW else timestamp
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"TelemetryData({fields})"
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    __hash__ = None
 
     def update(self, new_data: Dict[str, Any]) -> None:
         """
@@ -30,6 +98,49 @@ class TelemetryData:
             else:
                 raise KeyError(f"TelemetryData has no attribute named '{key}'")
 
+    @property
+    def flags_bits(self) -> int:
+        """
+        Packs the status flags into a single integer bitfield.
+
+        :return: Integer with one bit per status flag.
+        """
+        flags = self.status_flags
+        bits = 0
+        for name, mask in STATUS_FLAG_MASKS:
+            if flags.get(name, False):
+                bits |= mask
+        return bits
+
+    @property
+    def timestamp_seconds(self) -> float:
+        """
+        Returns the timestamp as POSIX seconds.
+        """
+        timestamp = self.timestamp
+        if isinstance(timestamp, datetime):
+            return timestamp.timestamp()
+        return timestamp
+
+    @property
+    def timestamp_iso(self) -> str:
+        """
+        Returns the timestamp as an ISO 8601 string in UTC.
+        """
+        timestamp = self.timestamp
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.fromtimestamp(timestamp, timezone.utc)
+        return timestamp.isoformat()
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        """
+        Returns the fields in declaration order without building a dictionary or formatting the timestamp.
+
+        :return: (position, orientation, velocity, acceleration, voltage, status_flags, timestamp)
+        """
+        return (self.position, self.orientation, self.velocity, self.acceleration,
+                self.voltage, self.status_flags, self.timestamp)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Converts the telemetry data into a dictionary format for easier manipulation and logging.
@@ -43,5 +154,65 @@ class TelemetryData:
             'acceleration': self.acceleration,
             'voltage': self.voltage,
             'status_flags': self.status_flags,
-            'timestamp': self.timestamp.isoformat(),
-        }
\ No newline at end of file
+            'timestamp': self.timestamp_iso,
+        }
+
+
+class TelemetryBuffer:
+    """
+    Fixed-capacity history of telemetry samples stored column-wise in one structured
+    array of SCALPEL_DTYPE records, instead of a list of TelemetryData objects.
+    Once full, the oldest sample is overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        self.records = np.zeros(capacity, dtype=SCALPEL_DTYPE)
+        self.capacity = capacity
+        self.head = 0  # Index the next sample is written to
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _advance(self) -> None:
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def push_raw(self, packet: bytes) -> None:
+        """
+        Appends one decoded SCALPEL packet with a single record copy.
+
+        :param packet: Decoded packet bytes, SCALPEL_DTYPE.itemsize long.
+        """
+        self.records[self.head] = np.frombuffer(packet, dtype=SCALPEL_DTYPE, count=1)[0]
+        self._advance()
+
+    def push(self, telemetry: TelemetryData) -> None:
+        """
+        Appends one TelemetryData sample.
+
+        :param telemetry: Sample to store.
+        """
+        record = self.records[self.head]
+        record['position'] = telemetry.position
+        record['orientation'] = telemetry.orientation
+        record['velocity'] = telemetry.velocity
+        record['acceleration'] = telemetry.acceleration
+        record['voltage'] = telemetry.voltage
+        record['status_flags'] = telemetry.flags_bits
+        record['timestamp'] = telemetry.timestamp_seconds
+        self._advance()
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns one field for every stored sample, oldest first.
+        This is a view until the buffer wraps, and a copy afterwards.
+
+        :param name: SCALPEL_DTYPE field name, e.g. 'voltage' or 'position'.
+        :return: Array with one entry per stored sample.
+        """
+        column = self.records[name]
+        if self.count < self.capacity:
+            return column[:self.count]
+        return np.concatenate((column[self.head:], column[:self.head]))